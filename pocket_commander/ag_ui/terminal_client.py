@@ -1,9 +1,11 @@
 #%%
 import asyncio
 import logging
+import os
 import uuid
 import typing
-from typing import Callable, Awaitable, Any, Optional, List, Dict, Type
+from collections import OrderedDict, deque
+from typing import Callable, Awaitable, Any, Deque, Optional, List, Dict, Type
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.history import FileHistory
@@ -12,7 +14,6 @@ from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 from rich.console import Console
 from rich.text import Text
-from rich.markup import escape
 
 from pocket_commander.types import AppServices
 from pocket_commander.event_bus import ZeroMQEventBus
@@ -28,6 +29,10 @@ from pocket_commander.ag_ui.types import Role as AgUiRole # For user message pub
 
 logger = logging.getLogger(__name__)
 
+CONSOLE_LOGGING_BUFFER_SIZE = int(os.environ.get("CONSOLE_LOGGING_BUFFER_SIZE", "8000")) # Max queued output lines
+_MAX_LINES_PER_FLUSH = 64 # Lines coalesced into a single console.print
+_TEXT_CACHE_MAX_SIZE = 256 # Distinct (text, style) pairs kept as prebuilt Rich Text objects
+
 # Adapted from TerminalInteractionFlow
 class AppStateAwareCompleter(Completer):
     """
@@ -64,6 +69,20 @@ class TerminalAgUIClient(AbstractAgUIClient):
     renders ag_ui events, and handles dedicated input prompts.
     """
 
+    # Role -> Rich style / markup prefix, looked up once per rendered message
+    _ROLE_STYLES: Dict[str, str] = {
+        "user": "green",
+        "assistant": "blue",
+        "tool": "yellow",
+        "system": "dim cyan",
+        "error": "bold red",
+    }
+    _ROLE_PREFIXES: Dict[str, str] = {
+        "user": "[bold green]You:[/bold green] ",
+        "tool": "[bold yellow]Tool Result:[/bold yellow] ",
+        "system": "[dim cyan]System:[/dim cyan] ",
+    }
+
     def __init__(self, app_services: AppServices, client_id: str = "terminal_main"):
         super().__init__(app_services, client_id)
         self.console = Console()
@@ -82,12 +101,19 @@ class TerminalAgUIClient(AbstractAgUIClient):
         self._message_roles: Dict[str, str] = {} # message_id -> role
         self._tool_call_args_buffers: Dict[str, List[str]] = {} # tool_call_id -> list of arg deltas
         self._tool_call_names: Dict[str, str] = {} # tool_call_id -> tool_name
+        self._line_buffer: List[typing.Union[Text, str]] = [] # Fragments pending the next writeln()
+        self._output_queue: Optional[asyncio.Queue] = None # Completed lines awaiting the drainer
+        self._output_drainer_task: Optional[asyncio.Task] = None
+        self._output_backlog: Deque[typing.Union[Text, str]] = deque() # Lines waiting for room in the full output queue
+        self._output_flush_task: Optional[asyncio.Task] = None # Single flusher for the backlog, shared by every waiting writer
+        self._text_cache: "OrderedDict[typing.Tuple[str, str, bool], Text]" = OrderedDict() # LRU of repeated Text objects
 
         # AI! Subscription configuration using new topic strings and direct handlers
         self._subscription_config: List[Dict[str, Any]] = [
             {"topic": "ag_ui.text_message.start", "handler_method_name": "_handle_text_message_stream", "priority": 0},
             {"topic": "ag_ui.text_message.content", "handler_method_name": "_handle_text_message_stream", "priority": 0},
             {"topic": "ag_ui.text_message.end", "handler_method_name": "_handle_text_message_stream", "priority": 0},
+            {"topic": "ag_ui.text_message.batch", "handler_method_name": "_handle_text_message_batch", "priority": 0},
             {"topic": "ag_ui.tool_call.start", "handler_method_name": "_handle_tool_call_stream", "priority": 0},
             {"topic": "ag_ui.tool_call.args", "handler_method_name": "_handle_tool_call_stream", "priority": 0},
             {"topic": "ag_ui.tool_call.end", "handler_method_name": "_handle_tool_call_stream", "priority": 0},
@@ -110,6 +136,10 @@ class TerminalAgUIClient(AbstractAgUIClient):
 
     async def initialize(self) -> None:
         """Subscribe to events needed by the terminal client using string topics and direct handlers."""
+        if self._output_drainer_task is None or self._output_drainer_task.done():
+            self._output_queue = asyncio.Queue(maxsize=CONSOLE_LOGGING_BUFFER_SIZE)
+            self._output_drainer_task = asyncio.create_task(self._drain_output_queue())
+
         if not self.event_bus:
             logger.error("ZeroMQEventBus not available in TerminalAgUIClient during initialization.")
             return
@@ -126,7 +156,7 @@ class TerminalAgUIClient(AbstractAgUIClient):
                     handler_coroutine=actual_handler_method,
                     priority=priority
                 )
-                logger.debug(f"TerminalAgUIClient subscribed handler '{handler_method_name}' to topic '{topic}' with priority {priority}.")
+                logger.debug("TerminalAgUIClient subscribed handler '%s' to topic '%s' with priority %s.", handler_method_name, topic, priority)
             except AttributeError:
                 logger.error(f"Failed to subscribe: Handler method '{handler_method_name}' not found in TerminalAgUIClient.")
             except Exception as e:
@@ -141,126 +171,230 @@ class TerminalAgUIClient(AbstractAgUIClient):
         logger.warning(f"TerminalAgUIClient received event via generic handle_ag_ui_event (should be handled by specific ZMQ subscribers): {type(event)}")
         pass
 
+    # --- Buffered Console Output ---
+
+    def write(self, fragment: typing.Union[Text, str]) -> None:
+        """Appends a fragment to the current output line without printing it."""
+        self._line_buffer.append(fragment)
+
+    def _cached_text(self, text: str, style: str = "", markup: bool = False) -> Text:
+        """Returns a shared Text for repeated (text, style) pairs, skipping style/markup parsing.
+        Cached objects are only ever passed to console.print or Text.assemble, which do not mutate them.
+        Only for fixed strings: per-event text would push the repeated entries out of the LRU."""
+        key = (text, style, markup)
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            self._text_cache.move_to_end(key)
+            return cached
+        cached = Text.from_markup(text, style=style) if markup else Text(text, style=style)
+        self._text_cache[key] = cached
+        if len(self._text_cache) > _TEXT_CACHE_MAX_SIZE:
+            self._text_cache.popitem(last=False)
+        return cached
+
+    def writeln(self, fragment: typing.Union[Text, str, None] = None) -> Optional[Awaitable[None]]:
+        """
+        Appends an optional final fragment and flushes the line with a single console.print.
+
+        While the drainer runs, the line is queued for it. If the queue is full, the line is kept in
+        order in a backlog and the backlog's flush task is returned; the caller awaits it (event handlers
+        return it to the bus), so a terminal that falls behind slows the producer instead of losing output.
+        Every call made while the backlog is non-empty returns the same task.
+        """
+        if fragment is not None:
+            self._line_buffer.append(fragment)
+        if not self._line_buffer:
+            return None
+        line = self._line_buffer[0] if len(self._line_buffer) == 1 else Text.assemble(*self._line_buffer)
+        self._line_buffer = []
+        if self._output_queue is not None and self._output_drainer_task and not self._output_drainer_task.done():
+            if not self._output_backlog: # Lines already waiting go first
+                try:
+                    self._output_queue.put_nowait(line)
+                    return None
+                except asyncio.QueueFull:
+                    pass
+            self._output_backlog.append(line)
+            if self._output_flush_task is None or self._output_flush_task.done():
+                self._output_flush_task = asyncio.ensure_future(self._flush_output_backlog())
+            return self._output_flush_task
+        self.console.print(line) # No drainer running, so nothing else is writing to the console
+        return None
+
+    async def _print_line(self, line: typing.Union[Text, str]) -> None:
+        """writeln for async callers outside event dispatch: waits for queue room itself.
+        Every console write goes through writeln, so lines keep their order and only the drainer prints."""
+        pending = self.writeln(line)
+        if pending is not None:
+            await pending
+
+    async def _flush_output_backlog(self) -> None:
+        """Moves backlogged lines into the output queue in order, waiting for room as the drainer catches up.
+        Runs only as _output_flush_task, so lines appended while it waits are picked up by the same loop."""
+        while self._output_backlog and self._output_queue is not None:
+            await self._output_queue.put(self._output_backlog[0])
+            self._output_backlog.popleft() # Removed only once queued, so writeln keeps deferring to it
+
+    async def _drain_output_queue(self) -> None:
+        """Coalesces queued lines and prints each batch once, off the event loop."""
+        loop = asyncio.get_running_loop()
+        queue = self._output_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _MAX_LINES_PER_FLUSH and not queue.empty():
+                batch.append(queue.get_nowait())
+            lines = [Text.from_markup(line) if isinstance(line, str) else line for line in batch]
+            batched_text = lines[0] if len(lines) == 1 else Text("\n").join(lines)
+            try:
+                await loop.run_in_executor(None, self.console.print, batched_text)
+            except Exception as e:
+                logger.error(f"TerminalClient: Failed to flush console output: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _stop_output_drainer(self) -> None:
+        """Flushes pending output and stops the drainer task."""
+        if self._output_drainer_task and not self._output_drainer_task.done():
+            if self._output_queue is not None:
+                if self._output_flush_task is not None:
+                    await self._output_flush_task
+                await self._output_queue.join()
+            self._output_drainer_task.cancel()
+            try:
+                await self._output_drainer_task
+            except asyncio.CancelledError:
+                pass
+        self._output_drainer_task = None
+        self._output_queue = None
+
     # --- Refactored ag_ui Event Handlers for Output ---
+    # These are plain functions: they only buffer or enqueue output, so the event bus
+    # calls them directly instead of creating and scheduling a coroutine per event.
+    # When the output queue is full they return writeln's pending write, which the bus awaits.
 
-    async def _handle_text_message_stream(self, topic: str, event_data: dict) -> None:
+    def _handle_text_message_stream(self, topic: str, event_data: dict) -> Optional[Awaitable[None]]:
         """Handles TEXT_MESSAGE_START, TEXT_MESSAGE_CONTENT, and TEXT_MESSAGE_END events based on topic."""
-        
-        # Determine event type from topic
-        # Example: "ag_ui.text_message.start" -> TEXT_MESSAGE_START
-        event_type_str = topic.split('.')[-1].upper() # e.g. START, CONTENT, END
-        
         try:
+            message_id = event_data.get("message_id") # Shared by all three event kinds; read once
             # Map string to enum member if needed, or use string directly
             # For simplicity, we'll compare with expected topic suffixes
             if topic.endswith("text_message.start"):
                 # specific_event = ag_ui_events.TextMessageStartEvent.model_validate(event_data) # Optional Pydantic validation
-                message_id = event_data.get("message_id")
                 role = event_data.get("role")
-                logger.debug(f"TerminalClient: TextMessageStart: ID={message_id}, Role={role} (Topic: {topic})")
+                logger.debug("TerminalClient: TextMessageStart: ID=%s, Role=%s (Topic: %s)", message_id, role, topic)
                 if message_id:
                     self._message_buffers[message_id] = []
                     self._message_roles[message_id] = role if role else "unknown"
                 if role == "assistant":
-                    self.console.print(Text("...", style="italic dim"))
+                    return self.writeln(self._cached_text("...", "italic dim"))
 
             elif topic.endswith("text_message.content"):
                 # specific_event = ag_ui_events.TextMessageContentEvent.model_validate(event_data)
-                message_id = event_data.get("message_id")
                 delta = event_data.get("delta")
-                logger.debug(f"TerminalClient: TextMessageContent: ID={message_id}, Delta='{escape(delta)[:50]}...' (Topic: {topic})")
-                if message_id in self._message_buffers:
-                    self._message_buffers[message_id].append(delta if delta else "")
+                logger.debug("TerminalClient: TextMessageContent: ID=%s, Delta='%.50s...' (Topic: %s)", message_id, delta, topic)
+                message_buffer = self._message_buffers.get(message_id)
+                if message_buffer is not None:
+                    message_buffer.append(delta if delta else "")
                 else:
                     logger.warning(f"TerminalClient: Received TextMessageContentEvent for unknown message_id {message_id} (Topic: {topic})")
             
             elif topic.endswith("text_message.end"):
                 # specific_event = ag_ui_events.TextMessageEndEvent.model_validate(event_data)
-                message_id = event_data.get("message_id")
-                logger.debug(f"TerminalClient: TextMessageEnd: ID={message_id} (Topic: {topic})")
+                logger.debug("TerminalClient: TextMessageEnd: ID=%s (Topic: %s)", message_id, topic)
                 role = self._message_roles.pop(message_id, "unknown")
                 buffered_content = "".join(self._message_buffers.pop(message_id, []))
                 
-                style = self._get_style_for_role(role)
-                prefix = ""
-                if role == "user":
-                    prefix = "[bold green]You:[/bold green] "
-                elif role == "assistant":
+                style = self._ROLE_STYLES.get(role, "")
+                if role == "assistant": # Only prefix that depends on runtime state
                     agent_slug = self.app_services.get_current_agent_slug() if self.app_services else 'AI'
                     prefix = f"[bold blue]Assistant ({agent_slug}):[/bold blue] "
-                elif role == "tool":
-                    prefix = "[bold yellow]Tool Result:[/bold yellow] "
-                elif role == "system":
-                    prefix = "[dim cyan]System:[/dim cyan] "
+                else:
+                    prefix = self._ROLE_PREFIXES.get(role, "")
                 
-                self.console.print(Text.from_markup(prefix) + Text(buffered_content, style=style))
+                if prefix:
+                    self.write(self._cached_text(prefix, markup=True))
+                return self.writeln(Text(buffered_content, style=style))
             else:
                 logger.warning(f"TerminalClient: _handle_text_message_stream received unexpected topic: {topic}")
 
         except Exception as e:
             logger.error(f"TerminalClient: Error processing text message stream for topic '{topic}': {e}\nData: {event_data}")
+        return None
 
 
-    async def _handle_tool_call_stream(self, topic: str, event_data: dict) -> None:
+    # Envelope key -> the single-event topic its payload would otherwise have been published on
+    _TEXT_MESSAGE_BATCH_PARTS = (
+        ("start", "ag_ui.text_message.start"),
+        ("content", "ag_ui.text_message.content"),
+        ("end", "ag_ui.text_message.end"),
+    )
+
+    def _handle_text_message_batch(self, topic: str, event_data: dict) -> Optional[Awaitable[None]]:
+        """Handles a complete text message published as one {"start", "content"?, "end"} envelope."""
+        pending = None
+        for part_key, part_topic in self._TEXT_MESSAGE_BATCH_PARTS:
+            part_data = event_data.get(part_key)
+            if part_data is not None: # "content" is omitted for empty messages
+                # writeln hands every part the same backlog flush task, so keeping any one covers them all
+                pending = self._handle_text_message_stream(part_topic, part_data) or pending
+        return pending
+
+    def _handle_tool_call_stream(self, topic: str, event_data: dict) -> Optional[Awaitable[None]]:
         """Handles TOOL_CALL_START, TOOL_CALL_ARGS, and TOOL_CALL_END events based on topic."""
         try:
+            tool_call_id = event_data.get("tool_call_id") # Shared by all three event kinds; read once
             if topic.endswith("tool_call.start"):
                 # specific_event = ag_ui_events.ToolCallStartEvent.model_validate(event_data)
-                tool_call_id = event_data.get("tool_call_id")
                 tool_name = event_data.get("tool_name")
-                logger.debug(f"TerminalClient: ToolCallStart: ID={tool_call_id}, Name={tool_name} (Topic: {topic})")
+                logger.debug("TerminalClient: ToolCallStart: ID=%s, Name=%s (Topic: %s)", tool_call_id, tool_name, topic)
                 if tool_call_id:
                     self._tool_call_args_buffers[tool_call_id] = []
                     self._tool_call_names[tool_call_id] = tool_name if tool_name else "unknown_tool"
-                self.console.print(Text(f"Calling tool: {tool_name} (ID: {tool_call_id})...", style="italic magenta"))
+                return self.writeln(Text(f"Calling tool: {tool_name} (ID: {tool_call_id})...", style="italic magenta"))
 
             elif topic.endswith("tool_call.args"):
                 # specific_event = ag_ui_events.ToolCallArgsEvent.model_validate(event_data)
-                tool_call_id = event_data.get("tool_call_id")
                 delta = event_data.get("delta")
-                logger.debug(f"TerminalClient: ToolCallArgs: ID={tool_call_id}, Delta='{escape(delta)[:50]}...' (Topic: {topic})")
-                if tool_call_id in self._tool_call_args_buffers:
-                    self._tool_call_args_buffers[tool_call_id].append(delta if delta else "")
+                logger.debug("TerminalClient: ToolCallArgs: ID=%s, Delta='%.50s...' (Topic: %s)", tool_call_id, delta, topic)
+                args_buffer = self._tool_call_args_buffers.get(tool_call_id)
+                if args_buffer is not None:
+                    args_buffer.append(delta if delta else "")
                 else:
                     logger.warning(f"TerminalClient: Received ToolCallArgsEvent for unknown tool_call_id {tool_call_id} (Topic: {topic})")
 
             elif topic.endswith("tool_call.end"):
                 # specific_event = ag_ui_events.ToolCallEndEvent.model_validate(event_data)
-                tool_call_id = event_data.get("tool_call_id")
-                logger.debug(f"TerminalClient: ToolCallEnd: ID={tool_call_id} (Topic: {topic})")
+                logger.debug("TerminalClient: ToolCallEnd: ID=%s (Topic: %s)", tool_call_id, topic)
                 tool_name = self._tool_call_names.pop(tool_call_id, "unknown_tool")
                 logger.info(f"Tool '{tool_name}' (ID: {tool_call_id}) call processing finished by agent.")
             else:
                 logger.warning(f"TerminalClient: _handle_tool_call_stream received unexpected topic: {topic}")
         except Exception as e:
             logger.error(f"TerminalClient: Error processing tool call stream for topic '{topic}': {e}\nData: {event_data}")
+        return None
 
     def _get_style_for_role(self, role: str) -> str:
-        if role == "user": return "green"
-        if role == "assistant": return "blue"
-        if role == "tool": return "yellow"
-        if role == "system": return "dim cyan"
-        if role == "error": return "bold red"
-        return ""
-
-    async def _handle_run_error(self, topic: str, event_data: dict):
+        return self._ROLE_STYLES.get(role, "")
+
+    def _handle_run_error(self, topic: str, event_data: dict) -> Optional[Awaitable[None]]:
         # event = ag_ui_events.RunErrorEvent.model_validate(event_data) # Optional Pydantic validation
         message = event_data.get("message", "Unknown error")
         code = event_data.get("code", "N/A")
         logger.error(f"TerminalClient: Received RunErrorEvent (Topic: {topic}): {message} (Code: {code})")
-        self.console.print(Text(f"Error during run: {message}", style="bold red"))
+        return self.writeln(Text.assemble((f"Error during run: {message}", "bold red"), (f" (Code: {code})", "dim")))
 
-    async def _handle_step_started(self, topic: str, event_data: dict):
+    def _handle_step_started(self, topic: str, event_data: dict) -> Optional[Awaitable[None]]:
         # event = ag_ui_events.StepStartedEvent.model_validate(event_data) # Optional Pydantic validation
         step_name = event_data.get("step_name", "Unnamed step")
         logger.info(f"TerminalClient: Step Started (Topic: {topic}): {step_name}")
-        self.console.print(Text(f"Step Started: {step_name}", style="dim"))
+        return self.writeln(Text(f"Step Started: {step_name}", style="dim"))
 
-    async def _handle_step_finished(self, topic: str, event_data: dict):
+    def _handle_step_finished(self, topic: str, event_data: dict) -> Optional[Awaitable[None]]:
         # event = ag_ui_events.StepFinishedEvent.model_validate(event_data) # Optional Pydantic validation
         step_name = event_data.get("step_name", "Unnamed step")
         logger.info(f"TerminalClient: Step Finished (Topic: {topic}): {step_name}")
-        self.console.print(Text(f"Step Finished: {step_name}", style="dim"))
+        return self.writeln(Text(f"Step Finished: {step_name}", style="dim"))
 
     # --- Dedicated Prompt Handling ---
     async def _handle_request_prompt_event(self, topic: str, event_data: dict):
@@ -271,7 +405,7 @@ class TerminalAgUIClient(AbstractAgUIClient):
         
         correlation_id = event_data.get("correlation_id")
         prompt_message = event_data.get("prompt_message", "Enter input:")
-        logger.debug(f"TerminalClient: Received RequestPromptEvent (Topic: {topic}, id: {correlation_id}): {prompt_message}")
+        logger.debug("TerminalClient: Received RequestPromptEvent (Topic: %s, id: %s): %s", topic, correlation_id, prompt_message)
         
         # Store the raw event_data as it might be needed by _main_loop
         self.active_dedicated_prompt_request = event_data 
@@ -292,7 +426,7 @@ class TerminalAgUIClient(AbstractAgUIClient):
         # 1. Publish user's own message for display (as ag_ui events with new topics)
         # This part makes the user's own input appear in their terminal.
         user_message_id = str(uuid.uuid4())
-        logger.debug(f"[{self.client_id}] Publishing user's own input display events (message_id: {user_message_id}) for: '{user_input}'")
+        logger.debug("[%s] Publishing user's own input display events (message_id: %s) for: '%s'", self.client_id, user_message_id, user_input)
         
         try:
             # TextMessageStart
@@ -318,7 +452,7 @@ class TerminalAgUIClient(AbstractAgUIClient):
                 message_id=user_message_id
             ).model_dump()
             await self.event_bus.publish(ag_ui_events.Topics.TEXT_MESSAGE_END, end_event_data)
-            logger.debug(f"[{self.client_id}] Successfully published user display events for '{user_input}'.")
+            logger.debug("[%s] Successfully published user display events for '%s'.", self.client_id, user_input)
         except Exception as e:
             logger.error(f"[{self.client_id}] Error publishing user display events for '{user_input}': {e}", exc_info=True)
             # Continue to attempt publishing AppInputEvent anyway
@@ -435,7 +569,7 @@ class TerminalAgUIClient(AbstractAgUIClient):
         self._running = True
         await self.initialize() # Subscribe to events
         logger.info(f"TerminalAgUIClient '{self.client_id}' started.")
-        self.console.print(f"[bold cyan]Welcome to Pocket Commander (Client: {self.client_id})![/bold cyan]")
+        await self._print_line(f"[bold cyan]Welcome to Pocket Commander (Client: {self.client_id})![/bold cyan]")
         
         self._main_loop_task = asyncio.create_task(self._main_loop())
 
@@ -459,6 +593,7 @@ class TerminalAgUIClient(AbstractAgUIClient):
             except asyncio.CancelledError:
                 logger.info(f"Main input loop for '{self.client_id}' was cancelled.")
         self._main_loop_task = None
+        await self._stop_output_drainer()
         logger.info(f"TerminalAgUIClient '{self.client_id}' stopped.")
 
 
@@ -476,7 +611,7 @@ class TerminalAgUIClient(AbstractAgUIClient):
                     correlation_id = prompt_event_data.get("correlation_id")
                     response_event_topic = prompt_event_data.get("response_event_type") # This is the topic
 
-                    logger.debug(f"TerminalClient MainLoop: Processing dedicated prompt (id: {correlation_id}): {prompt_message}")
+                    logger.debug("TerminalClient MainLoop: Processing dedicated prompt (id: %s): %s", correlation_id, prompt_message)
                     
                     user_input_str = await self.session.prompt_async(
                         f"{prompt_message}: ",
@@ -522,10 +657,10 @@ class TerminalAgUIClient(AbstractAgUIClient):
 
             except KeyboardInterrupt:
                 if not self._running: break
-                self.console.print("\n[italic yellow]Keyboard interrupt. Type /exit or /quit to exit.[/italic yellow]")
+                await self._print_line("\n[italic yellow]Keyboard interrupt. Type /exit or /quit to exit.[/italic yellow]")
             except EOFError:
                 if not self._running: break
-                self.console.print("\n[bold red]EOF received. Exiting...[/bold red]")
+                await self._print_line("\n[bold red]EOF received. Exiting...[/bold red]")
                 if self._running: 
                     await self.send_app_input("/exit")
                 break 
@@ -534,10 +669,10 @@ class TerminalAgUIClient(AbstractAgUIClient):
                 break
             except Exception as e:
                 if not self._running: break
-                self.console.print(f"[bold red]An unexpected error occurred in terminal client '{self.client_id}': {e}[/bold red]")
+                await self._print_line(f"[bold red]An unexpected error occurred in terminal client '{self.client_id}': {e}[/bold red]")
                 logger.exception(f"Terminal client '{self.client_id}' main loop error")
                 await asyncio.sleep(1) 
 
         logger.info(f"Terminal client '{self.client_id}' main interaction loop ended.")
         if self._running : 
-             self.console.print(f"Terminal client {self.client_id} session ended.")
\ No newline at end of file
+             await self._print_line(f"Terminal client {self.client_id} session ended.")
\ No newline at end of file
@@ -19,6 +19,9 @@ class AgentResolver:
     """
     Resolves agent configurations by loading Python modules and identifying
     target agent classes or composition functions based on configuration and conventions.
+    resolve_agent_config may be called from several threads at once: the module-level caches
+    only see single dict get/set operations and importlib serializes imports per module,
+    so a race at worst repeats a lookup.
     """
 
     def _load_module_from_path(self, module_path_str: str) -> Optional[Any]:
@@ -32,7 +35,7 @@ class AgentResolver:
         try:
             module = importlib.import_module(module_path_str)
             _module_cache[module_path_str] = module
-            logger.debug(f"Successfully loaded and cached module: {module_path_str}")
+            logger.debug("Successfully loaded and cached module: %s", module_path_str)
             return module
         except ImportError as e:
             logger.error(f"Failed to import module '{module_path_str}': {e}", exc_info=True)
@@ -67,7 +70,7 @@ class AgentResolver:
                     # Further validation might be needed here if we can inspect return type,
                     # but for now, assume it returns a BaseNode compatible instance.
                     target = func_target
-                    logger.debug(f"Resolved target by composition_function_name: {composition_function_name} in {module_path_str}")
+                    logger.debug("Resolved target by composition_function_name: %s in %s", composition_function_name, module_path_str)
                 else:
                     logger.warning(f"Attribute '{composition_function_name}' in module '{module_path_str}' is not callable.")
             else:
@@ -79,7 +82,7 @@ class AgentResolver:
                 cls_target = getattr(module, class_name)
                 if inspect.isclass(cls_target) and issubclass(cls_target, BaseNode):
                     target = cls_target
-                    logger.debug(f"Resolved target by class_name: {class_name} in {module_path_str}")
+                    logger.debug("Resolved target by class_name: %s in %s", class_name, module_path_str)
                 else:
                     logger.warning(f"Attribute '{class_name}' in module '{module_path_str}' is not a class or not a subclass of BaseNode.")
             else:
@@ -92,7 +95,7 @@ class AgentResolver:
                 cls_agent = getattr(module, "Agent")
                 if inspect.isclass(cls_agent) and issubclass(cls_agent, BaseNode):
                     target = cls_agent
-                    logger.debug(f"Resolved target by convention: class 'Agent' in {module_path_str}")
+                    logger.debug("Resolved target by convention: class 'Agent' in %s", module_path_str)
             
             # Convention 3.2: Class name matching filename (CamelCase)
             if not target:
@@ -101,7 +104,7 @@ class AgentResolver:
                     cls_filename_match = getattr(module, convention_class_name)
                     if inspect.isclass(cls_filename_match) and issubclass(cls_filename_match, BaseNode):
                         target = cls_filename_match
-                        logger.debug(f"Resolved target by convention: class '{convention_class_name}' in {module_path_str}")
+                        logger.debug("Resolved target by convention: class '%s' in %s", convention_class_name, module_path_str)
 
             # Convention 3.3: Flow composition function by filename
             if not target:
@@ -114,7 +117,7 @@ class AgentResolver:
                         func_convention = getattr(module, func_name)
                         if callable(func_convention):
                             target = func_convention
-                            logger.debug(f"Resolved target by convention: function '{func_name}' in {module_path_str}")
+                            logger.debug("Resolved target by convention: function '%s' in %s", func_name, module_path_str)
                             break # Found one, stop checking convention functions
         
         if target:
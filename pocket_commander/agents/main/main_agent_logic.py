@@ -67,7 +67,7 @@ async def _main_agent_non_command_processor(
     agent_name: str
 ):
     """Handles input that isn't a recognized command in main agent."""
-    logger.debug(f"Main agent non-command input: {raw_input_str}")
+    logger.debug("Main agent non-command input: %s", raw_input_str)
     output_handler = app_services['output_handler']
     await output_handler.send_message(
         f"Main Agent received: '{raw_input_str}'. This is not a known command. Type 'help'.",
@@ -147,7 +147,10 @@ def create_main_agent_logic(
         if cmd_word and cmd_word in command_map:
             cmd_to_run = command_map[cmd_word]
             try:
-                parsed_args = await parse_arguments(command_input, cmd_to_run.parameters)
+                if not cmd_to_run.parameters and not command_input.get_remaining_input().strip():
+                    parsed_args = {} # No-arg command without extra tokens: nothing to parse
+                else:
+                    parsed_args = await parse_arguments(command_input, cmd_to_run.parameters)
                 
                 ctx = CommandContext(
                     input=command_input,
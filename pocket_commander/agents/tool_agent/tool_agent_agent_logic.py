@@ -195,7 +195,7 @@ async def _adapted_internal_execute_tool_request_handler(
     app_services: AppServices 
 ):
     try:
-        logger.debug(f"ToolAgentLogic adapter received data for InternalExecuteToolRequest: {data} on topic {topic}")
+        logger.debug("ToolAgentLogic adapter received data for InternalExecuteToolRequest: %s on topic %s", data, topic)
         event_model = InternalExecuteToolRequest(**data)
         await _handle_internal_execute_tool_request(event_model, app_services)
     except Exception as e:
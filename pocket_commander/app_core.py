@@ -8,7 +8,7 @@ from typing import Dict, List, Callable, Awaitable, Any, Optional
 
 from pocket_commander.commands.definition import CommandDefinition, ParameterDefinition
 from pocket_commander.commands.io import AbstractCommandInput
-from pocket_commander.commands.terminal_io import StringCommandInput # For parsing global command args
+from pocket_commander.commands.terminal_io import StringCommandInput, seed_word_cache # For parsing global command args
 from pocket_commander.commands.core import CommandContext
 from pocket_commander.commands.parser import parse_arguments, ArgumentParsingError
 from pocket_commander.types import AppServices, AgentConfig
@@ -41,6 +41,25 @@ from pocket_commander.ag_ui.types import InternalBaseEvent # For _publish_event
 
 logger = logging.getLogger(__name__)
 
+# Specific topics as per task requirements for ag_ui.events published by AppCore.
+# Built once at import instead of on every _publish_event call.
+_SPECIFIC_AG_UI_TOPICS: Dict[ag_ui_events.EventType, str] = {
+    ag_ui_events.EventType.TEXT_MESSAGE_START: "ag_ui.text_message.start",
+    ag_ui_events.EventType.TEXT_MESSAGE_CONTENT: "ag_ui.text_message.content",
+    ag_ui_events.EventType.TEXT_MESSAGE_END: "ag_ui.text_message.end",
+    ag_ui_events.EventType.RUN_STARTED: "ag_ui.run.started",
+    ag_ui_events.EventType.MESSAGES_SNAPSHOT: "ag_ui.messages.snapshot",
+    
+    # Added as per Stage 4 requirements for AppCore publishing to UI
+    ag_ui_events.EventType.TOOL_CALL_START: "ag_ui.tool_call.start",
+    ag_ui_events.EventType.TOOL_CALL_ARGS: "ag_ui.tool_call.args",
+    ag_ui_events.EventType.TOOL_CALL_END: "ag_ui.tool_call.end",
+    ag_ui_events.EventType.RUN_ERROR: "ag_ui.run.error",
+    ag_ui_events.EventType.STEP_STARTED: "ag_ui.step.started",
+    ag_ui_events.EventType.STEP_FINISHED: "ag_ui.step.finished",
+    ag_ui_events.EventType.REQUEST_PROMPT: "RequestPromptEvent", # Per spec, topic is "RequestPromptEvent"
+}
+
 
 from pocket_commander.ag_ui.client import AbstractAgUIClient # AI! Add import
 
@@ -78,9 +97,11 @@ class AppCore:
         self.ui_client: Optional[Any] = None # Will be TerminalAgUIClient instance
 
     # --- Event Publishing Helper ---
-    async def _publish_event(self, event_instance: InternalBaseEvent):
+    async def _publish_event(self, event_instance: InternalBaseEvent, topic_suffix: Optional[str] = None):
         """Helper to publish Pydantic events via ZeroMQEventBus.
         Uses specific hierarchical topics for ag_ui.events as per requirements.
+        topic_suffix (e.g. the target agent's slug) is appended as a final topic segment so
+        subscribers can filter by ZeroMQ prefix instead of inspecting every payload.
         """
         topic: str
         
@@ -91,38 +112,21 @@ class AppCore:
             
             event_type_enum_member = event_instance.type # This is the ag_ui_events.EventType enum member
             
-            # Specific topics as per task requirements for ag_ui.events published by AppCore
-            specific_topic_map = {
-                ag_ui_events.EventType.TEXT_MESSAGE_START: "ag_ui.text_message.start",
-                ag_ui_events.EventType.TEXT_MESSAGE_CONTENT: "ag_ui.text_message.content",
-                ag_ui_events.EventType.TEXT_MESSAGE_END: "ag_ui.text_message.end",
-                ag_ui_events.EventType.RUN_STARTED: "ag_ui.run.started",
-                ag_ui_events.EventType.MESSAGES_SNAPSHOT: "ag_ui.messages.snapshot",
-                
-                # Added as per Stage 4 requirements for AppCore publishing to UI
-                ag_ui_events.EventType.TOOL_CALL_START: "ag_ui.tool_call.start",
-                ag_ui_events.EventType.TOOL_CALL_ARGS: "ag_ui.tool_call.args",
-                ag_ui_events.EventType.TOOL_CALL_END: "ag_ui.tool_call.end",
-                ag_ui_events.EventType.RUN_ERROR: "ag_ui.run.error",
-                ag_ui_events.EventType.STEP_STARTED: "ag_ui.step.started",
-                ag_ui_events.EventType.STEP_FINISHED: "ag_ui.step.finished",
-                ag_ui_events.EventType.REQUEST_PROMPT: "RequestPromptEvent", # Per spec, topic is "RequestPromptEvent"
-            }
-            
-            if event_type_enum_member in specific_topic_map:
-                topic = specific_topic_map[event_type_enum_member]
-            else:
+            topic = _SPECIFIC_AG_UI_TOPICS.get(event_type_enum_member)
+            if topic is None:
                 # Generic hierarchical topic for other ag_ui.events not in the specific map
                 # This converts ENUM_VALUE_NAME to ag_ui.enum.value.name
                 generic_topic_suffix = event_type_enum_member.value.lower().replace('_', '.')
                 topic = f"{ag_ui_events.AG_UI_EVENT_PREFIX}.{generic_topic_suffix}"
                 logger.info(
                     f"Using generic hierarchical topic '{topic}' for ag_ui event type: {event_type_enum_member}. "
-                    f"If a specific topic is required by protocol, add to specific_topic_map."
+                    f"If a specific topic is required by protocol, add to _SPECIFIC_AG_UI_TOPICS."
                 )
         else:
             # For non-ag_ui_events (like InternalExecuteToolRequest) or events not matching the ag_ui.BaseEvent structure
             topic = type(event_instance).__name__ # Original fallback, e.g., "InternalExecuteToolRequest"
+        if topic_suffix:
+            topic = f"{topic}.{topic_suffix}"
         
         event_data_dict = event_instance.model_dump(mode='json')
         await self.event_bus.publish(topic, event_data_dict)
@@ -153,7 +157,7 @@ class AppCore:
     async def _handle_tool_call_start_zmq(self, topic: str, data: dict):
         try:
             event = ToolCallStartEvent(**data)
-            logger.debug(f"AppCore ZMQ: Received ToolCallStartEvent for ID {event.tool_call_id}, Name: {event.tool_name} on topic {topic}")
+            logger.debug("AppCore ZMQ: Received ToolCallStartEvent for ID %s, Name: %s on topic %s", event.tool_call_id, event.tool_name, topic)
             self.application_state["pending_tool_call_starts"][event.tool_call_id] = event
             self.application_state["pending_tool_call_args"][event.tool_call_id] = ""
         except Exception as e:
@@ -162,7 +166,7 @@ class AppCore:
     async def _handle_tool_call_args_zmq(self, topic: str, data: dict):
         try:
             event = ToolCallArgsEvent(**data)
-            logger.debug(f"AppCore ZMQ: Received ToolCallArgsEvent for ID {event.tool_call_id}, Delta: {event.delta[:50]}... on topic {topic}")
+            logger.debug("AppCore ZMQ: Received ToolCallArgsEvent for ID %s, Delta: %.50s... on topic %s", event.tool_call_id, event.delta, topic)
             if event.tool_call_id in self.application_state["pending_tool_call_args"]:
                 self.application_state["pending_tool_call_args"][event.tool_call_id] += event.delta
             else:
@@ -173,7 +177,7 @@ class AppCore:
     async def _handle_tool_call_end_zmq(self, topic: str, data: dict):
         try:
             event = ToolCallEndEvent(**data)
-            logger.debug(f"AppCore ZMQ: Received ToolCallEndEvent for ID {event.tool_call_id} on topic {topic}")
+            logger.debug("AppCore ZMQ: Received ToolCallEndEvent for ID %s on topic %s", event.tool_call_id, topic)
             
             start_event = self.application_state["pending_tool_call_starts"].pop(event.tool_call_id, None)
             accumulated_args = self.application_state["pending_tool_call_args"].pop(event.tool_call_id, None)
@@ -337,6 +341,7 @@ class AppCore:
             self.application_state["global_commands"][cmd_def.name] = cmd_def
             for alias in cmd_def.aliases:
                 self.application_state["global_commands"][alias] = cmd_def
+        seed_word_cache(list(self.application_state["global_commands"].keys()))
     
     async def initialize_core(self):
         """Initializes the AppCore, subscribes to events, and sets up global commands.
@@ -383,21 +388,27 @@ class AppCore:
             # event_data is the raw dict from ZMQ, AppInputEvent.model_validate handles parsing
             event = AppInputEvent.model_validate(event_data) # Use model_validate for Pydantic v2
             raw_input_str = event.input_text.strip()
-            logger.debug(f"AppCore ZMQ received AppInputEvent from '{event.source_ui_client_id}': '{raw_input_str}' on topic '{topic}'")
+            logger.debug("AppCore ZMQ received AppInputEvent from '%s': '%s' on topic '%s'", event.source_ui_client_id, raw_input_str, topic)
 
-            potential_cmd_word_full = raw_input_str.split(" ", 1)[0]
+            # Prefix checked on the raw string; the command word and argument tail are sliced out only for
+            # "/" input, so agent input is never split into a list and a copy of its tail
+            is_global_cmd_input = raw_input_str.startswith("/")
 
-            if potential_cmd_word_full.startswith("/"):
-                global_cmd_word = potential_cmd_word_full[1:]
+            if is_global_cmd_input:
+                space_index = raw_input_str.find(" ")
+                global_cmd_word = raw_input_str[1:space_index] if space_index != -1 else raw_input_str[1:]
                 
                 if global_cmd_word in self.application_state["global_commands"]:
                     cmd_to_run = self.application_state["global_commands"][global_cmd_word]
-                    args_string = raw_input_str.partition(" ")[2] 
+                    args_string = raw_input_str[space_index + 1:] if space_index != -1 else ""
                     
                     temp_cmd_input = StringCommandInput(args_string)
                     
                     try:
-                        parsed_args = await parse_arguments(temp_cmd_input, cmd_to_run.parameters)
+                        if not cmd_to_run.parameters and not args_string.strip():
+                            parsed_args = {} # No-arg command without extra tokens: nothing to parse
+                        else:
+                            parsed_args = await parse_arguments(temp_cmd_input, cmd_to_run.parameters)
                         
                         prompt_function = getattr(self.app_services.output_handler, 'prompt_for_input', lambda prompt, sensitive: asyncio.sleep(0, result="dummy_prompt"))
 
@@ -428,10 +439,10 @@ class AppCore:
                 run_id = str(uuid.uuid4())
                 thread_id = active_agent_slug 
                 
-                logger.info(f"Publishing RunStartedEvent for agent '{active_agent_slug}', Run ID: {run_id}, Input: {raw_input_str[:50]}...")
+                logger.info("Publishing RunStartedEvent for agent '%s', Run ID: %s, Input: %.50s...", active_agent_slug, run_id, raw_input_str)
                 # Publishing RunStartedEvent now uses _publish_event, which will apply the correct topic.
                 # [MEMORY BANK: ACTIVE]
-                await self._publish_event(RunStartedEvent(type=ag_ui_events.EventType.RUN_STARTED, thread_id=thread_id, run_id=run_id))
+                await self._publish_event(RunStartedEvent(type=ag_ui_events.EventType.RUN_STARTED, thread_id=thread_id, run_id=run_id), topic_suffix=active_agent_slug)
                 
                 user_message_id = str(uuid.uuid4())
                 content_to_send = raw_input_str if raw_input_str else "" 
@@ -443,9 +454,9 @@ class AppCore:
                 
                 # Publishing MessagesSnapshotEvent now uses _publish_event, which will apply the correct topic.
                 # [MEMORY BANK: ACTIVE]
-                await self._publish_event(MessagesSnapshotEvent(type=ag_ui_events.EventType.MESSAGES_SNAPSHOT, messages=[user_message]))
+                await self._publish_event(MessagesSnapshotEvent(type=ag_ui_events.EventType.MESSAGES_SNAPSHOT, messages=[user_message]), topic_suffix=active_agent_slug)
                 logger.info(f"Published MessagesSnapshotEvent with UserMessage (ID: {user_message_id}) for Run ID: {run_id}")
-            elif not (potential_cmd_word_full.startswith("/")): 
+            elif not is_global_cmd_input: 
                 await self._publish_system_text_message(f"No active agent for input: '{raw_input_str}'. Use '/agent <name>'.")
         except Exception as e:
             logger.error(f"AppCore ZMQ: Error processing AppInputEvent data: {e}. Data: {event_data}", exc_info=True)
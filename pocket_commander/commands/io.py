@@ -8,6 +8,10 @@ T = TypeVar('T')
 # Type definition for the interactive prompt function
 PromptFunc = Callable[[str, Optional[str]], Awaitable[str]]
 
+def needs_shlex_split(text: str) -> bool:
+    """True if the text has quoting or escapes that a plain whitespace split would get wrong."""
+    return '"' in text or "'" in text or "\\" in text
+
 class AbstractCommandInput(ABC):
     """
     Abstract base class for command input handling.
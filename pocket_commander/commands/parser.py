@@ -1,16 +1,33 @@
 #%%
 # pocket_commander/commands/parser.py
+# Kept mypyc-compatible: `mypyc pocket_commander/commands/parser.py` builds an extension
+# that takes import precedence over this file, falling back to pure Python when absent.
+import functools
 import inspect
 import shlex
-from typing import Any, Dict, List, Optional, Type, Union, get_origin, get_args
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, get_origin, get_args
 
 from pocket_commander.commands.definition import ParameterDefinition
-from pocket_commander.commands.io import AbstractCommandInput
+from pocket_commander.commands.io import AbstractCommandInput, needs_shlex_split
 
 class ArgumentParsingError(ValueError):
     """Custom exception for argument parsing errors."""
     pass
 
+@functools.lru_cache(maxsize=512)
+def _origin_and_args(target_type: Any) -> Tuple[Any, Tuple[Any, ...]]:
+    """Returns get_origin/get_args for a type hint, cached since type hints are hashable and static."""
+    return get_origin(target_type), get_args(target_type)
+
+@functools.lru_cache(maxsize=512)
+def _bool_flag_tokens(param_name: str) -> Tuple[frozenset, frozenset]:
+    """Returns the (true, false) flag token sets accepted for a boolean parameter."""
+    return (
+        frozenset((f"--{param_name}", f"-{param_name}", param_name)),
+        frozenset((f"--no-{param_name}", f"--no{param_name}")),
+    )
+
 async def parse_arguments(
     command_input: AbstractCommandInput,
     param_definitions: List[ParameterDefinition]
@@ -38,12 +55,23 @@ async def parse_arguments(
         ArgumentParsingError: If parsing fails due to type mismatches,
                               missing required arguments, or other issues.
     """
+    # No-argument commands (e.g. 'tools') skip tokenization entirely.
+    if not param_definitions:
+        remaining_input = command_input.get_remaining_input().strip()
+        if remaining_input:
+            raise ArgumentParsingError(f"Unexpected arguments: {remaining_input}")
+        return {}
+
     parsed_args: Dict[str, Any] = {}
-    # Use shlex to split arguments respecting quotes
-    try:
-        input_tokens = shlex.split(command_input.get_remaining_input())
-    except ValueError as e:
-        raise ArgumentParsingError(f"Error splitting input: {e}. Check for unmatched quotes.") from e
+    # Use shlex to split arguments respecting quotes; plain input takes the much cheaper str.split()
+    remaining_input = command_input.get_remaining_input()
+    if needs_shlex_split(remaining_input):
+        try:
+            input_tokens = shlex.split(remaining_input)
+        except ValueError as e:
+            raise ArgumentParsingError(f"Error splitting input: {e}. Check for unmatched quotes.") from e
+    else:
+        input_tokens = remaining_input.split()
     
     token_idx = 0
     param_def_idx = 0
@@ -55,17 +83,17 @@ async def parse_arguments(
         # --- Handle Variadic Positional Arguments (*args) ---
         if param_def.name.startswith('*'): # Convention: *args_name
             actual_name = param_def.name[1:]
-            # Consume all remaining positional tokens
-            remaining_tokens = input_tokens[token_idx:]
             
             # Type cast each token if a specific list item type is provided (e.g., List[int])
             list_item_type = str # Default to string if not further specified
-            if get_origin(param_def.param_type) is list and get_args(param_def.param_type):
-                list_item_type = get_args(param_def.param_type)[0]
+            param_origin, param_args = _origin_and_args(param_def.param_type)
+            if param_origin is list and param_args:
+                list_item_type = param_args[0]
 
             try:
+                # Consume all remaining positional tokens without copying the tail of the list
                 parsed_args[actual_name] = [
-                    _cast_value(token, list_item_type, param_def.name) for token in remaining_tokens
+                    _cast_value(token, list_item_type, param_def.name) for token in islice(input_tokens, token_idx, None)
                 ]
             except ValueError as e:
                 raise ArgumentParsingError(str(e)) from e
@@ -86,12 +114,14 @@ async def parse_arguments(
             
             # Simple boolean flag check (e.g. --flag or no-flag)
             if param_def.param_type is bool:
-                if token.lower() in [f"--{param_def.name}", f"-{param_def.name}", param_def.name]: # if token is like --verbose
+                true_tokens, false_tokens = _bool_flag_tokens(param_def.name)
+                low_token = token.lower()
+                if low_token in true_tokens: # if token is like --verbose
                     parsed_args[param_def.name] = True
                     token_idx +=1
                     param_def_idx +=1
                     continue
-                elif token.lower() in [f"--no-{param_def.name}", f"--no{param_def.name}"]:
+                elif low_token in false_tokens:
                     parsed_args[param_def.name] = False
                     token_idx +=1
                     param_def_idx +=1
@@ -108,7 +138,7 @@ async def parse_arguments(
                 if param_def.required and param_def.default is None:
                     raise ArgumentParsingError(str(e)) from e
                 # If not required or has default, we'll let the later check handle it
-                parsed_args[param_def.name] = param_def.default # Tentatively set default
+                parsed_args[param_def.name] = param_def.default # Tentatively set default, None included
         
         param_def_idx += 1
 
@@ -143,12 +173,11 @@ async def parse_arguments(
 
     return parsed_args
 
-def _cast_value(value_str: str, target_type: Type, param_name: str) -> Any:
+def _cast_value(value_str: str, target_type: Any, param_name: str) -> Any:
     """Casts a string value to the target type."""
-    origin_type = get_origin(target_type)
+    origin_type, args = _origin_and_args(target_type)
     
     if origin_type is Union: # Handles Optional[T] which is Union[T, NoneType]
-        args = get_args(target_type)
         if type(None) in args: # It's an Optional
             non_none_types = [t for t in args if t is not type(None)]
             if not non_none_types: # Should not happen with valid Optional
@@ -194,7 +223,7 @@ def _cast_value(value_str: str, target_type: Type, param_name: str) -> Any:
     # but direct casting from a single string token to these types is complex.
     # This parser assumes individual tokens are being cast.
     # For e.g. List[int], the variadic handling does item-wise casting.
-    if origin_type is list and get_args(target_type): # e.g. List[int]
+    if origin_type is list and args: # e.g. List[int]
         # This case is more for type-hinting a single argument that should be a list
         # e.g. --items 1,2,3.  The current token-by-token parsing doesn't directly support this
         # without custom splitting logic for that token.
@@ -1,21 +1,40 @@
 #%%
 # pocket_commander/commands/terminal_io.py
-import asyncio 
-import uuid 
+import shlex
+import sys
 import logging 
 from typing import Any, Dict, Optional, Type, TypeVar, List
-from rich.console import Console # Keep for potential direct use, though TerminalAgUIClient has its own
 
-from pocket_commander.commands.io import AbstractCommandInput # AbstractOutputHandler removed
-from pocket_commander.event_bus import ZeroMQEventBus # Removed BaseEvent as it's unused
-# SystemMessageEvent and AgentOutputEvent are less relevant for direct terminal output now
-# from pocket_commander.events import SystemMessageEvent, SystemMessageType 
-# from pocket_commander.events import AgentOutputEvent 
+from pocket_commander.commands.io import AbstractCommandInput, needs_shlex_split # AbstractOutputHandler removed
 
 logger = logging.getLogger(__name__) 
 
 T = TypeVar('T')
 
+_BOOL_TRUE = frozenset(('true', '1', 'yes', 'y')) # Values get_argument treats as True for bool hints
+
+_IDX_STRS = tuple(str(i) for i in range(32)) # Precomputed keys for typical positional arg counts
+
+_WORD_CACHE: Dict[str, str] = {} # Interned command words and short argument tokens
+_WORD_CACHE_MAX_SIZE = 1024 # Stop caching new words past this to keep long sessions bounded
+_INTERN_TOKEN_MAX_LEN = 8 # Longer argument tokens are rarely repeated, so they are not interned
+
+def _intern_word(word: str) -> str:
+    """Returns a shared instance of a repeated command word or short token."""
+    cached = _WORD_CACHE.get(word)
+    if cached is not None:
+        return cached
+    if len(_WORD_CACHE) >= _WORD_CACHE_MAX_SIZE:
+        return word
+    word = sys.intern(word)
+    _WORD_CACHE[word] = word
+    return word
+
+def seed_word_cache(words: List[str]) -> None:
+    """Pre-populates the word cache, e.g. with registered command names at startup."""
+    for word in words:
+        _intern_word(word)
+
 class TerminalCommandInput(AbstractCommandInput):
     """
     Terminal-specific implementation of command input.
@@ -23,10 +42,15 @@ class TerminalCommandInput(AbstractCommandInput):
     """
     def __init__(self, full_input_str: str):
         self._raw_input_str = full_input_str 
-        self._command_word: Optional[str] = None
+        self._command_word: Optional[str] = None # None until parsed; see _ensure_parsed()
         self._args_str: str = "" 
         self._parsed_args: Optional[List[str]] = None 
-        self._parse_command_and_args_string()
+        self._args_dict_cache: Optional[Dict[str, Any]] = None # Built on first get_all_arguments() call
+
+    def _ensure_parsed(self):
+        """Splits the command word from its arguments on first use only."""
+        if self._command_word is None:
+            self._parse_command_and_args_string()
 
     def _parse_command_and_args_string(self):
         """Parses the command word and the rest of the arguments string."""
@@ -36,20 +60,31 @@ class TerminalCommandInput(AbstractCommandInput):
             self._args_str = ""
             return
         
-        parts = stripped_input.split(" ", 1)
-        self._command_word = parts[0]
-        if len(parts) > 1:
-            self._args_str = parts[1]
-        else:
-            self._args_str = ""
+        # partition avoids building a list and hands back the shared empty string when there are no args
+        command_word, _, self._args_str = stripped_input.partition(" ")
+        self._command_word = _intern_word(command_word)
 
     def _parse_args_list_if_needed(self):
         """Parses the _args_str into a list if not already done."""
         if self._parsed_args is None:
-            self._parsed_args = self._args_str.strip().split() if self._args_str.strip() else []
+            self._ensure_parsed()
+            if not self._args_str:
+                self._parsed_args = []
+                return
+            tokens = self._args_str.split() # split() already ignores surrounding whitespace
+            if needs_shlex_split(self._args_str): # Quoted tokens only; shlex is far slower than str.split()
+                try:
+                    tokens = shlex.split(self._args_str)
+                except ValueError:
+                    logger.debug("Unbalanced quotes in arguments, using plain whitespace split: %r", self._args_str)
+            self._parsed_args = [
+                _intern_word(token) if len(token) <= _INTERN_TOKEN_MAX_LEN else token
+                for token in tokens
+            ]
 
     def get_command_word(self) -> Optional[str]:
         """Returns the identified command word (the first word of the input)."""
+        self._ensure_parsed()
         return self._command_word
 
     def get_argument(self, name: str, type_hint: Type[T] = str, default: Optional[T] = None) -> Optional[T]:
@@ -58,12 +93,18 @@ class TerminalCommandInput(AbstractCommandInput):
         'name' is treated as an integer index.
         """
         self._parse_args_list_if_needed()
-        try:
+        if name.isdigit(): # Common plain-index case, converted without a try/except round-trip
             index = int(name)
+        else:
+            try:
+                index = int(name)
+            except ValueError:
+                return default
+        try:
             if self._parsed_args and 0 <= index < len(self._parsed_args):
                 value_str = self._parsed_args[index]
                 if type_hint == bool:
-                    return value_str.lower() in ['true', '1', 'yes', 'y'] # type: ignore
+                    return value_str.lower() in _BOOL_TRUE # type: ignore
                 return type_hint(value_str)
             return default
         except (ValueError, IndexError):
@@ -73,16 +114,23 @@ class TerminalCommandInput(AbstractCommandInput):
         """
         Returns arguments (from the string *after* the command word) as a dictionary
         with indices as keys, and also 'raw_string' for the full argument string part.
+        The dictionary is built once and shared between calls; treat it as read-only.
         """
-        self._parse_args_list_if_needed()
-        args_dict = {str(i): val for i, val in enumerate(self._parsed_args or [])}
-        args_dict["raw_string"] = self._args_str 
-        return args_dict
+        if self._args_dict_cache is None:
+            self._parse_args_list_if_needed()
+            args_dict = {
+                (_IDX_STRS[i] if i < len(_IDX_STRS) else str(i)): val
+                for i, val in enumerate(self._parsed_args or [])
+            }
+            args_dict["raw_string"] = self._args_str 
+            self._args_dict_cache = args_dict
+        return self._args_dict_cache
 
     def get_remaining_input(self) -> str:
         """
         Returns the portion of the input string *after* the command word.
         """
+        self._ensure_parsed()
         return self._args_str
 
 class StringCommandInput(TerminalCommandInput): # Added for clarity, used in app_core
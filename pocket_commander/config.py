@@ -0,0 +1,31 @@
+#%%
+# pocket_commander/config.py
+# Lightweight facade over pocket_commander.config_loader. Importing this module is cheap;
+# the heavy loader (Pydantic models, tool registry, agent resolver) is only imported on
+# first attribute access (PEP 562), so code paths that never read config skip that cost.
+import importlib
+from typing import Any, List
+
+_HEAVY_MODULE = "pocket_commander.config_loader"
+
+__all__ = [
+    "AppConfig",
+    "LLMProfile",
+    "LoggingConfig",
+    "ApplicationSettings",
+    "ZeroMQEventBusConfig",
+    "YAML_TO_PYTHON_TYPE_MAP",
+    "get_python_type_from_yaml_str",
+    "load_and_resolve_app_config",
+    "load_and_register_mcp_tools_from_config",
+]
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_HEAVY_MODULE), name)
+    globals()[name] = value # Later lookups hit the module dict and skip __getattr__
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,9 @@
-import yaml
+import functools
 import logging
 import os
-from typing import Dict, Any, List, Type, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Type
 
 from pocket_commander.pocketflow.base import BaseNode # Ensure BaseNode is defined
 from pydantic import BaseModel, Field # Added BaseModel and Field
@@ -23,13 +25,31 @@ YAML_TO_PYTHON_TYPE_MAP: Dict[str, Type[Any]] = {
     "object": dict,
 }
 
+# Common casings precomputed so most lookups skip the str.lower() allocation
+_TYPE_LOOKUP: Dict[str, Type[Any]] = {
+    variant: py_type
+    for base, py_type in YAML_TO_PYTHON_TYPE_MAP.items()
+    for variant in (base, base.upper(), base.capitalize())
+}
+_TYPE_LOOKUP_GET = _TYPE_LOOKUP.get
+
+# Resolved configs keyed by (config path, st_mtime_ns, st_size, st_ino, cwd); cwd matters for agent resolution.
+# Values are (app_config, validated) so a trusted, unvalidated build never satisfies a validating call.
+_APP_CONFIG_CACHE: "OrderedDict[Tuple[str, int, int, int, str], Tuple[AppConfig, bool]]" = OrderedDict()
+_APP_CONFIG_CACHE_MAX_SIZE = 16
+_AGENT_RESOLVE_MAX_WORKERS = 8
+
 # Pydantic Models for Configuration
+# Nested settings models are frozen: cached AppConfig instances are shared between callers.
 class ZeroMQEventBusConfig(BaseModel):
     broker_publisher_frontend_address: str
     broker_subscriber_frontend_address: str
     broker_xsub_bind_address: Optional[str] = None
     broker_xpub_bind_address: Optional[str] = None
 
+    class Config:
+        frozen = True
+
 class LoggingConfig(BaseModel):
     level: str = "INFO"
     file_path: Optional[str] = "pocket_commander.log"
@@ -37,10 +57,16 @@ class LoggingConfig(BaseModel):
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     levels: Optional[Dict[str, str]] = None
 
+    class Config:
+        frozen = True
+
 class ApplicationSettings(BaseModel):
     default_agent: Optional[str] = "main"
     # Add other application-specific settings here
 
+    class Config:
+        frozen = True
+
 class LLMProfile(BaseModel):
     provider: Optional[str] = None
     api_key_name: Optional[str] = None
@@ -50,6 +76,7 @@ class LLMProfile(BaseModel):
     # Allow any other fields for flexibility
     class Config:
         extra = "allow"
+        frozen = True
 
 class AppConfig(BaseModel):
     llm_profiles: Dict[str, LLMProfile] = Field(default_factory=dict)
@@ -58,35 +85,116 @@ class AppConfig(BaseModel):
     logging: Optional[LoggingConfig] = None
     agents: Dict[str, Any] = Field(default_factory=dict) # Raw agent config from YAML
     resolved_agents: Dict[str, AgentConfig] = Field(default_factory=dict) # Processed AgentConfig objects
-    mcp_tools: Optional[List[Dict[str, Any]]] = None # Raw MCP tool config from YAML
+    mcp_tools: Optional[List[Any]] = None # Raw MCP tool config from YAML; items are shape-checked once at registration
     zeromq_event_bus: Optional[ZeroMQEventBusConfig] = None
 
     class Config:
         extra = "ignore" # Ignore extra fields from YAML at the top level if not defined in AppConfig
 
+try:
+    AppConfig.model_rebuild() # Resolve forward refs once per process instead of on every load
+except Exception as e:
+    logger.error(f"Failed to rebuild AppConfig model at import time: {e}", exc_info=True)
+
 
 def get_python_type_from_yaml_str(type_str: str) -> Type[Any]:
     """Converts a YAML type string to a Python type."""
-    return YAML_TO_PYTHON_TYPE_MAP.get(type_str.lower(), str)
-
-def load_and_resolve_app_config(config_path: str = "pocket_commander.conf.yaml") -> Optional[AppConfig]:
+    py_type = _TYPE_LOOKUP_GET(type_str)
+    if py_type is None: # Unusual casing (e.g. "sTrInG") or unknown type
+        py_type = YAML_TO_PYTHON_TYPE_MAP.get(type_str.lower(), str)
+    return py_type
+
+@functools.lru_cache(maxsize=None)
+def _get_yaml() -> Tuple[Any, Any]:
+    """Imports yaml on first config load and returns (yaml module, fastest safe Loader)."""
+    import yaml
+    # LibYAML-backed parser, much faster than pure Python
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def _construct_trusted_app_config(raw_config_data: Dict[str, Any]) -> AppConfig:
+    """Builds AppConfig and its nested models via model_construct, skipping validation."""
+    nested_models: Dict[str, Type[BaseModel]] = {
+        "application": ApplicationSettings,
+        "logging": LoggingConfig,
+        "zeromq_event_bus": ZeroMQEventBusConfig,
+    }
+    fields = dict(raw_config_data)
+    for field_name, model_cls in nested_models.items():
+        if isinstance(fields.get(field_name), dict):
+            fields[field_name] = model_cls.model_construct(**fields[field_name])
+    if isinstance(fields.get("llm_profiles"), dict):
+        fields["llm_profiles"] = {
+            name: LLMProfile.model_construct(**profile) if isinstance(profile, dict) else profile
+            for name, profile in fields["llm_profiles"].items()
+        }
+    return AppConfig.model_construct(**fields)
+
+def load_and_resolve_app_config(config_path: str = "pocket_commander.conf.yaml", trusted: bool = False) -> Optional[AppConfig]:
     """
     Loads the main application configuration from the specified YAML file,
     resolves agent configurations, and returns an AppConfig Pydantic model.
+    Results are cached per file version, so repeated calls on an unchanged file
+    return the same (read-only) AppConfig instance.
+    Pass trusted=True only for reloads of an already-vetted file: Pydantic validation
+    is skipped, so schema errors are not reported. The default keeps full validation.
     """
     try:
-        project_root = os.getcwd()
+        config_stat = os.stat(config_path)
+    except FileNotFoundError:
+        logger.error(f"Configuration file not found: {config_path}")
+        return None
+    except OSError as e: # e.g. NotADirectoryError or PermissionError
+        logger.error(f"Could not access configuration file {config_path}: {e.strerror or e}")
+        return None
+
+    project_root = os.getcwd()
+    cache_key = (os.path.abspath(config_path), config_stat.st_mtime_ns, config_stat.st_size, config_stat.st_ino, project_root)
+    cached = _APP_CONFIG_CACHE.get(cache_key)
+    if cached is not None and (trusted or cached[1]):
+        _APP_CONFIG_CACHE.move_to_end(cache_key)
+        logger.debug("Reusing cached configuration for unchanged file %s.", config_path)
+        return cached[0]
 
-        with open(config_path, 'r') as f:
-            raw_config_data = yaml.safe_load(f)
+    try:
+        config_fd = os.open(config_path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+        try:
+            config_file = os.fdopen(config_fd, 'rb') # Loader decodes bytes itself, skipping a text-layer decode
+        except OSError: # e.g. the path is a directory
+            os.close(config_fd)
+            raise
+    except OSError as e: # strerror only: fdopen errors name the fd number rather than the path
+        logger.error(f"Could not open configuration file {config_path}: {e.strerror or e}")
+        return None
+
+    with config_file:
+        if hasattr(os, "posix_fadvise"): # Hint a single front-to-back read; purely advisory
+            try:
+                os.posix_fadvise(config_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        app_config = _load_and_resolve_app_config_uncached(config_file, config_path, project_root, trusted)
+
+    if app_config is not None: # Failed loads are not cached so a fixed environment is picked up
+        _APP_CONFIG_CACHE[cache_key] = (app_config, not trusted)
+        if len(_APP_CONFIG_CACHE) > _APP_CONFIG_CACHE_MAX_SIZE:
+            _APP_CONFIG_CACHE.popitem(last=False)
+    return app_config
+
+def _load_and_resolve_app_config_uncached(config_file: BinaryIO, config_path: str, project_root: str, trusted: bool = False) -> Optional[AppConfig]:
+    """Parses the open YAML file, validates it into AppConfig and resolves agents."""
+    yaml, yaml_loader = _get_yaml()
+    try:
+        raw_config_data = yaml.load(config_file, Loader=yaml_loader)
         if not isinstance(raw_config_data, dict):
             logger.error(f"Configuration file {config_path} did not load as a dictionary.")
             return None
 
         # Initialize AppConfig with raw data, Pydantic will handle parsing for known fields
         # For fields like 'agents' and 'mcp_tools', we store the raw data and process 'agents' later.
-        AppConfig.model_rebuild() # Ensure all forward refs are resolved
-        app_config = AppConfig(**raw_config_data)
+        if trusted:
+            app_config = _construct_trusted_app_config(raw_config_data)
+        else:
+            app_config = AppConfig(**raw_config_data)
 
         # Resolve agents
         agent_resolver = AgentResolver()
@@ -97,18 +205,35 @@ def load_and_resolve_app_config(config_path: str = "pocket_commander.conf.yaml")
             logger.error("'agents' section in configuration must be a dictionary. Skipping agent parsing.")
         else:
             discovery_folders_cfg = app_config.agent_discovery_folders
+            agent_entries: List[Tuple[str, Dict[str, Any]]] = []
             for agent_slug, agent_yaml_details in agents_yaml_section.items():
                 if not isinstance(agent_yaml_details, dict):
                     logger.error(f"Configuration for agent '{agent_slug}' is not a dictionary. Skipping.")
                     continue
-                
-                logger.debug(f"Attempting to resolve agent '{agent_slug}' with details: {agent_yaml_details}")
-                resolved_config = agent_resolver.resolve_agent_config(
+                agent_entries.append((agent_slug, agent_yaml_details))
+
+            def _resolve_agent(entry: Tuple[str, Dict[str, Any]]) -> Optional[AgentConfig]:
+                agent_slug, agent_yaml_details = entry
+                logger.debug("Attempting to resolve agent '%s' with details: %s", agent_slug, agent_yaml_details)
+                return agent_resolver.resolve_agent_config(
                     slug=agent_slug,
                     agent_yaml_config=agent_yaml_details,
                     project_root=project_root,
                     discovery_folders=discovery_folders_cfg
                 )
+
+            # Agents resolve independently (module imports and file-system lookups), so they overlap in a pool.
+            # map() keeps results in config order, so resolved_agents order matches the YAML.
+            if len(agent_entries) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(_AGENT_RESOLVE_MAX_WORKERS, len(agent_entries)),
+                    thread_name_prefix="agent-resolve"
+                ) as executor:
+                    resolved_configs = list(executor.map(_resolve_agent, agent_entries))
+            else:
+                resolved_configs = [_resolve_agent(entry) for entry in agent_entries]
+
+            for (agent_slug, _), resolved_config in zip(agent_entries, resolved_configs):
                 if resolved_config:
                     parsed_agent_configs[agent_slug] = resolved_config
                 else:
@@ -119,9 +244,6 @@ def load_and_resolve_app_config(config_path: str = "pocket_commander.conf.yaml")
         
         return app_config
 
-    except FileNotFoundError:
-        logger.error(f"Configuration file not found: {config_path}")
-        return None
     except yaml.YAMLError as e:
         logger.error(f"Error parsing YAML configuration file {config_path}: {e}")
         return None
@@ -130,6 +252,47 @@ def load_and_resolve_app_config(config_path: str = "pocket_commander.conf.yaml")
         return None
 
 
+def _parse_mcp_tool_parameters(tool_name: str, parameters_config: Optional[List[Any]]) -> List[ToolParameterDefinition]:
+    """Builds ToolParameterDefinitions from a tool's raw 'parameters' config list."""
+    parsed_parameters: List[ToolParameterDefinition] = []
+    if not parameters_config:
+        return parsed_parameters
+
+    # Bound once outside the loop to skip repeated method lookups per parameter
+    _get = dict.get
+    _type_for = YAML_TO_PYTHON_TYPE_MAP.get
+
+    for param_conf in parameters_config:
+        if param_conf.__class__ is not dict: # YAML/Pydantic only produce plain dicts here
+            logger.warning(f"Skipping invalid parameter configuration (not a dictionary) for tool {tool_name}: {param_conf}")
+            continue
+        
+        param_name = _get(param_conf, "name")
+        param_desc = _get(param_conf, "description")
+
+        if not param_name or not param_desc:
+            logger.warning(
+                f"Skipping parameter for tool '{tool_name}' due to missing 'name' or 'description': {param_conf}"
+            )
+            continue
+
+        param_type_str = _get(param_conf, "type", "string").lower()
+        param_is_required = _get(param_conf, "required", False)
+        param_default_value = _get(param_conf, "default")
+        actual_param_type = _type_for(param_type_str, str) # Same lookup as get_python_type_from_yaml_str
+
+        parsed_parameters.append(
+            ToolParameterDefinition(
+                name=param_name,
+                description=param_desc,
+                param_type=actual_param_type,
+                type_str=param_type_str,
+                is_required=param_is_required,
+                default_value=param_default_value
+            )
+        )
+    return parsed_parameters
+
 def load_and_register_mcp_tools_from_config(app_config: Optional[AppConfig], registry: ToolRegistry):
     """
     Loads MCP tool configurations from the AppConfig object and registers them.
@@ -153,66 +316,38 @@ def load_and_register_mcp_tools_from_config(app_config: Optional[AppConfig], reg
 
     logger.info(f"Found {len(mcp_tools_config)} MCP tool(s) in configuration. Attempting to register.")
 
+    # Bound once outside the loop to skip repeated method lookups per tool
+    _get = dict.get
+
     for tool_config in mcp_tools_config:
-        if not isinstance(tool_config, dict):
+        if tool_config.__class__ is not dict: # YAML/Pydantic only produce plain dicts here
             logger.warning(f"Skipping invalid MCP tool configuration item (not a dictionary): {tool_config}")
             continue
 
-        server_name = tool_config.get("server_name")
-        tool_name = tool_config.get("tool_name")
-        description = tool_config.get("description")
-        parameters_config = tool_config.get("parameters")
+        server_name = _get(tool_config, "server_name")
+        tool_name = _get(tool_config, "tool_name")
+        description = _get(tool_config, "description")
+        parameters_config = _get(tool_config, "parameters")
 
-        if not all([server_name, tool_name, description]):
+        if not server_name or not tool_name or not description:
             logger.warning(
                 f"Skipping MCP tool due to missing 'server_name', 'tool_name', or 'description': {tool_config}"
             )
             continue
         
-        if not isinstance(parameters_config, list) and parameters_config is not None:
+        if parameters_config is not None and parameters_config.__class__ is not list:
             logger.warning(
                 f"Skipping MCP tool '{tool_name}' on server '{server_name}' due to invalid 'parameters' format (must be a list or null)."
             )
             continue
 
-        parsed_parameters: List[ToolParameterDefinition] = []
-        if parameters_config:
-            for param_conf in parameters_config:
-                if not isinstance(param_conf, dict):
-                    logger.warning(f"Skipping invalid parameter configuration (not a dictionary) for tool {tool_name}: {param_conf}")
-                    continue
-                
-                param_name = param_conf.get("name")
-                param_desc = param_conf.get("description")
-                param_type_str = param_conf.get("type", "string")
-                param_is_required = param_conf.get("required", False)
-                param_default_value = param_conf.get("default")
-
-                if not param_name or not param_desc:
-                    logger.warning(
-                        f"Skipping parameter for tool '{tool_name}' due to missing 'name' or 'description': {param_conf}"
-                    )
-                    continue
-                
-                actual_param_type = get_python_type_from_yaml_str(param_type_str)
-
-                parsed_parameters.append(
-                    ToolParameterDefinition(
-                        name=param_name,
-                        description=param_desc,
-                        param_type=actual_param_type,
-                        type_str=param_type_str.lower(),
-                        is_required=param_is_required,
-                        default_value=param_default_value
-                    )
-                )
-        
         try:
-            registry.register_mcp_tool(
+            # Parameter definitions are built on first use of the tool rather than at startup
+            registry.register_mcp_tool_lazy(
                 mcp_server_name=server_name,
                 mcp_tool_name=tool_name,
                 mcp_tool_description=description,
-                mcp_tool_parameters=parsed_parameters,
+                mcp_tool_parameters_factory=functools.partial(_parse_mcp_tool_parameters, tool_name, parameters_config),
                 allow_override=True
             )
         except Exception as e:
@@ -1,40 +1,87 @@
 #%%
 # pocket_commander/core_agents/composer_agent.py
 import asyncio
+import collections
 import logging
-import uuid # For message IDs
-from typing import Dict, Any, Optional
+import sys
+import time
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, get_args
+
+from pydantic import TypeAdapter
 
 from pocket_commander.pocketflow.base import AsyncNode
+from pocket_commander.core_agents.lifecycle import AgentLifecycleMixin # Shared AgentLifecycleEvent handling
+from pocket_commander.core_agents.event_payloads import event_payload # Shared payload template copying
 from pocket_commander.types import AppServices
-from pocket_commander.zeromq_event_bus import ZeroMQEventBus # AI! Change to ZeroMQEventBus from pocket_commander.event_bus
+from pocket_commander.utils.ids import fast_uuid4_str # For message IDs
+from pocket_commander.event_bus import ZeroMQEventBus
 # Updated event imports
-from pocket_commander.events import AgentLifecycleEvent # AI! AppInputEvent removed as it's not directly used for subscription
 from pocket_commander.ag_ui import events as ag_ui_events
 from pocket_commander.ag_ui import types as ag_ui_types
 
 logger = logging.getLogger(__name__)
 
-class ComposerAgent(AsyncNode):
+# Inbound events are validated through adapters built once at import rather than Model.model_validate per event
+_RUN_STARTED_ADAPTER: TypeAdapter[ag_ui_events.RunStartedEvent] = TypeAdapter(ag_ui_events.RunStartedEvent)
+_SNAPSHOT_ADAPTER: TypeAdapter[ag_ui_events.MessagesSnapshotEvent] = TypeAdapter(ag_ui_events.MessagesSnapshotEvent)
+_SNAPSHOT_OFFLOAD_THRESHOLD = 32 # Snapshots with more messages than this are validated off the event loop
+
+# Outbound text message events have a fixed shape, so each is validated once here and its model_dump()
+# copied per message with event_payload, rather than constructing and dumping a model per message.
+# Start payloads are kept per role: a role outside ag_ui_types.Role has no template and is rejected.
+_TEXT_START_PAYLOADS: Dict[str, Dict[str, Any]] = {
+    role: ag_ui_events.TextMessageStartEvent(type=ag_ui_events.EventType.TEXT_MESSAGE_START, message_id="", role=role).model_dump()
+    for role in get_args(ag_ui_types.Role)
+}
+_TEXT_CONTENT_PAYLOAD = ag_ui_events.TextMessageContentEvent(
+    type=ag_ui_events.EventType.TEXT_MESSAGE_CONTENT, message_id="", delta=" ").model_dump()
+_TEXT_END_PAYLOAD = ag_ui_events.TextMessageEndEvent(type=ag_ui_events.EventType.TEXT_MESSAGE_END, message_id="").model_dump()
+
+# Known command words, interned so dispatch lookups on interned input hit dict entries by identity
+_HELP = sys.intern("help")
+_MAX_INTERNED_COMMAND_LEN = 32 # Longer input cannot be a command and is not added to the intern table
+
+class ComposerAgent(AgentLifecycleMixin, AsyncNode):
     """
     Agent for composing complex prompts or documents.
     Interacts via the event bus using ag_ui events.
     """
 
+    # Instance attributes set in __init__ live in slots; BaseNode's own attributes keep using __dict__
+    __slots__ = (
+        "app_services", "event_bus", "init_args", "slug", "llm_profile", "style_guide",
+        "_is_active", "_current_run_id", "_active_subscription_ids", "_message_history", "_help_text",
+        "_lifecycle_subscribed", "_track_history",
+    )
+
     def __init__(self, app_services: AppServices, **init_args: Any):
         super().__init__()
         self.app_services = app_services
         self.event_bus: ZeroMQEventBus = app_services.event_bus
         self.init_args = init_args
         
-        self.slug: str = init_args.get("slug", "composer")
+        self.slug: str = sys.intern(init_args.get("slug", "composer"))
         self.llm_profile: Optional[str] = init_args.get("llm_profile")
         self.style_guide: Optional[str] = init_args.get("style_guide")
         
         self._is_active = False
         self._current_run_id: Optional[str] = None # To associate messages with a run
-        self._message_history: list[ag_ui_types.Message] = []
+        self._active_subscription_ids: list[str] = [] # Held from activation until deactivation
+        self._lifecycle_subscribed = False # The lifecycle subscription is made once and kept for the agent's lifetime
+        # The composer only answers the newest message, so keeping history is opt-in
+        self._track_history: bool = init_args.get("track_history", False)
+        # Bounded FIFO: the oldest messages drop off once history_max is reached
+        self._message_history: Deque[ag_ui_types.Message] = collections.deque(maxlen=init_args.get("history_max", 256))
+        # slug/llm_profile/style_guide are fixed after init, so the help text is built once
+        self._help_text: str = f"""--- {self.slug} Agent Help ---
+The Composer Agent is responsible for composing complex prompts or documents.
+Currently, it will echo any input received.
+Configuration:
+  LLM Profile: {self.llm_profile}
+  Style Guide: {self.style_guide}
 
+Global commands (start with /) are handled by the application core.
+"""
 
         logger.info(f"ComposerAgent '{self.slug}' initialized with "
                     f"llm_profile='{self.llm_profile}', style_guide='{self.style_guide}'. "
@@ -42,7 +89,7 @@ class ComposerAgent(AsyncNode):
 
     async def _publish_text_message(self, content: str, role: ag_ui_types.Role = "assistant", parent_message_id: Optional[str] = None) -> str:
         """Helper to publish a complete text message sequence using ag_ui.events."""
-        message_id = str(uuid.uuid4())
+        message_id = fast_uuid4_str()
         
         # Create the message object for internal history (optional, but good practice)
         # common_message_args = {"id": message_id, "role": role, "content": content}
@@ -54,36 +101,51 @@ class ComposerAgent(AsyncNode):
         #     new_message = ag_ui_types.BaseMessage(**common_message_args) # Or more specific if needed
         # self._message_history.append(new_message)
 
-        start_event = ag_ui_events.TextMessageStartEvent(message_id=message_id, role=role, parent_message_id=parent_message_id) # AI! Add parent_message_id
-        await self.event_bus.publish(topic="ag_ui.text_message.start", event_data=start_event.model_dump(mode='json'))
+        start_payload = _TEXT_START_PAYLOADS.get(role)
+        if start_payload is None:
+            raise ValueError(f"Unknown message role for ComposerAgent '{self.slug}': {role!r}")
+
+        # parent_message_id is not part of the TextMessageStart schema, so it only shows up in the debug log
+        now = time.time()
+        envelope = {"start": event_payload(start_payload, now, message_id=message_id)}
         
-        if content:
-            content_event = ag_ui_events.TextMessageContentEvent(message_id=message_id, delta=content)
-            await self.event_bus.publish(topic="ag_ui.text_message.content", event_data=content_event.model_dump(mode='json'))
+        if content: # TextMessageContentEvent rejects an empty delta, so the key is omitted instead
+            envelope["content"] = event_payload(_TEXT_CONTENT_PAYLOAD, now, message_id=message_id, delta=content)
         
-        end_event = ag_ui_events.TextMessageEndEvent(message_id=message_id)
-        await self.event_bus.publish(topic="ag_ui.text_message.end", event_data=end_event.model_dump(mode='json'))
+        envelope["end"] = event_payload(_TEXT_END_PAYLOAD, now, message_id=message_id)
+        # The complete message is known up front, so it travels as one frame: one serialization,
+        # one ZMQ send and one subscriber wakeup instead of three
+        await self.event_bus.publish(topic="ag_ui.text_message.batch", event_data=envelope)
         
-        logger.debug(f"ComposerAgent '{self.slug}' published '{role}' message (ID: {message_id}): {content[:50]}...")
+        logger.debug("ComposerAgent '%s' published '%s' message (ID: %s, parent: %s): %.50s...", self.slug, role, message_id, parent_message_id, content)
         return message_id
 
     async def _subscribe_to_events(self):
         """Subscribes to necessary events. Called upon activation."""
         if self.event_bus:
-            # ComposerAgent now expects RunStartedEvent and MessagesSnapshotEvent like MainDefaultAgent
-            await self.event_bus.subscribe(topic_pattern="ag_ui.run.started", handler_coroutine=self.handle_run_started)
-            await self.event_bus.subscribe(topic_pattern="AgentLifecycleEvent", handler_coroutine=self.handle_lifecycle_event)
-            logger.info(f"ComposerAgent '{self.slug}' subscribed to 'ag_ui.run.started' and 'AgentLifecycleEvent'.")
+            # ComposerAgent now expects RunStartedEvent and MessagesSnapshotEvent like MainDefaultAgent.
+            # Snapshots are subscribed once per activation and filtered by _current_run_id, not per run.
+            # app_core suffixes both topics with the target agent's slug, so ZeroMQ's prefix filter
+            # drops other agents' runs before they reach this process.
+            run_started_topic = f"ag_ui.run.started.{self.slug}"
+            snapshot_topic = f"ag_ui.messages.snapshot.{self.slug}"
+            self._active_subscription_ids.append(
+                await self.event_bus.subscribe(topic_pattern=run_started_topic, handler_coroutine=self.handle_run_started)
+            )
+            self._active_subscription_ids.append(
+                await self.event_bus.subscribe(topic_pattern=snapshot_topic, handler_coroutine=self.handle_message_snapshot)
+            )
+            await self._ensure_lifecycle_subscription()
+            logger.info(f"ComposerAgent '{self.slug}' subscribed to '{run_started_topic}', '{snapshot_topic}' and 'AgentLifecycleEvent'.")
         else:
             logger.error(f"ComposerAgent '{self.slug}': Event bus not available for subscriptions.")
 
-    async def handle_lifecycle_event(self, topic: str, event_data: dict): # AI! Add topic: str, event_data: dict
-        event = AgentLifecycleEvent.model_validate(event_data) # AI! Reconstruct event
-        if event.agent_name == self.slug:
-            if event.lifecycle_type == "activating" and not self._is_active:
-                await self.on_agent_activate()
-            elif event.lifecycle_type == "deactivating" and self._is_active:
-                await self.on_agent_deactivate()
+    async def _ensure_lifecycle_subscription(self):
+        """Registers handle_lifecycle_event once; repeat subscriptions would dispatch every lifecycle event twice."""
+        if not self._lifecycle_subscribed:
+            self._lifecycle_subscribed = True # Set before the await so a concurrent caller cannot subscribe again
+            # The bus routes lifecycle events by agent_name, so only this agent's events reach the handler
+            await self.event_bus.register_lifecycle(self.slug, self.handle_lifecycle_event)
 
     async def on_agent_activate(self):
         """Logic to run when this agent becomes active."""
@@ -97,74 +159,83 @@ class ComposerAgent(AsyncNode):
     async def on_agent_deactivate(self):
         """Logic to run when this agent is being deactivated."""
         self._is_active = False
-        if self._current_run_id:
-            finish_event = ag_ui_events.RunFinishedEvent(thread_id=self.slug, run_id=self._current_run_id) # AI! thread_id is slug
-            await self.event_bus.publish(topic="ag_ui.run.finished", event_data=finish_event.model_dump(mode='json'))
-            self._current_run_id = None
-        
+        # State is reset before any await; the finish publish and the unsubscribes then run together
+        run_id = self._current_run_id
+        self._current_run_id = None
+        subscription_ids = self._active_subscription_ids
+        self._active_subscription_ids = []
+
+        pending = []
+        if run_id:
+            finish_event = ag_ui_events.RunFinishedEvent(type=ag_ui_events.EventType.RUN_FINISHED, thread_id=self.slug, run_id=run_id) # AI! thread_id is slug
+            pending.append(self.event_bus.publish(topic="ag_ui.run.finished", event_data=finish_event.model_dump(mode='json')))
         if self.event_bus:
-            # AI! Update unsubscriptions to use topic strings
-            await self.event_bus.unsubscribe(topic_pattern="ag_ui.run.started", handler_coroutine=self.handle_run_started)
-            await self.event_bus.unsubscribe(topic_pattern="ag_ui.messages.snapshot", handler_coroutine=self.handle_message_snapshot)
+            pending.extend(self.event_bus.unsubscribe(subscription_id) for subscription_id in subscription_ids)
+        if pending:
+            await asyncio.gather(*pending)
         logger.info(f"ComposerAgent '{self.slug}' deactivated and unsubscribed from run/message events.")
 
     async def handle_run_started(self, topic: str, event_data: dict): # AI! Add topic: str, event_data: dict
-        event = ag_ui_events.RunStartedEvent.model_validate(event_data) # AI! Reconstruct event
-        if not self._is_active:
+        if not self._is_active: # Topic is slug-specific, so no thread_id filtering is needed here
             return
-        # AI! Filter by thread_id if it's meant for this agent instance or a general broadcast
-        if event.thread_id != self.slug and event.thread_id is not None: # Assuming None thread_id is broadcast or handled by another mechanism
-             logger.debug(f"ComposerAgent '{self.slug}' ignoring RunStartedEvent for thread_id '{event.thread_id}'")
-             return
+        event = _RUN_STARTED_ADAPTER.validate_python(event_data) # AI! Reconstruct event
 
         self._current_run_id = event.run_id
-        self._message_history = []
-        logger.info(f"ComposerAgent '{self.slug}' received RunStartedEvent (ID: {event.run_id}, Thread: {event.thread_id}). Subscribing to MessagesSnapshotEvent.")
-        await self.event_bus.subscribe(topic_pattern="ag_ui.messages.snapshot", handler_coroutine=self.handle_message_snapshot)
+        self._message_history.clear()
+        logger.info(f"ComposerAgent '{self.slug}' received RunStartedEvent (ID: {event.run_id}, Thread: {event.thread_id}). Accepting MessagesSnapshotEvent for this run.")
 
     async def handle_message_snapshot(self, topic: str, event_data: dict): # AI! Add topic: str, event_data: dict
         """Handles snapshot of messages, typically containing user input."""
-        event = ag_ui_events.MessagesSnapshotEvent.model_validate(event_data) # AI! Reconstruct event
+        # Topic is slug-specific; this guard runs before validation since snapshots arrive between runs too
         if not self._is_active or not self._current_run_id:
             return
-        
-        # AI! Filter by thread_id if it's meant for this agent instance
-        if event.thread_id != self.slug:
-            logger.debug(f"ComposerAgent '{self.slug}' ignoring MessagesSnapshotEvent for thread_id '{event.thread_id}'")
-            return
+        messages_data = event_data.get("messages")
+        if type(messages_data) is list and len(messages_data) > _SNAPSHOT_OFFLOAD_THRESHOLD:
+            # Large snapshots are validated in a worker thread so the loop keeps serving other events
+            event = await asyncio.get_running_loop().run_in_executor(None, _SNAPSHOT_ADAPTER.validate_python, event_data)
+            if not self._is_active or not self._current_run_id: # Deactivated or run finished while validating
+                return
+        else:
+            event = _SNAPSHOT_ADAPTER.validate_python(event_data) # AI! Reconstruct event
 
-        self._message_history.extend(event.messages)
-        last_message = event.messages[-1] if event.messages else None
+        messages = event.messages
+        if self._track_history:
+            self._message_history.extend(messages) # C-level extend; [-1] below is O(1), no second pass
+        last_message = messages[-1] if messages else None
 
-        if last_message and last_message.role == "user" and isinstance(last_message.content, str):
+        # Only the newest message is answered, and only when it is plain user text
+        if last_message is not None and last_message.role == "user" and type(last_message.content) is str:
             raw_text = last_message.content.strip()
-            logger.debug(f"ComposerAgent '{self.slug}' received input: '{raw_text}' for run_id: {self._current_run_id}")
+            logger.debug("ComposerAgent '%s' received input: '%s' for run_id: %s", self.slug, raw_text, self._current_run_id)
 
-            if raw_text.lower() == "help":
-                await self._do_help(parent_message_id=last_message.id)
+            # Commands are short: only input that could be one is casefolded and interned for lookup
+            command_handler = None
+            if len(raw_text) <= _MAX_INTERNED_COMMAND_LEN:
+                command_handler = self._COMMANDS.get(sys.intern(raw_text.casefold()))
+            if command_handler:
+                await command_handler(self, parent_message_id=last_message.id)
             else:
                 response_message = f"Composer agent '{self.slug}' received: {raw_text}"
                 await self._publish_text_message(content=response_message, parent_message_id=last_message.id)
         
-        if self._current_run_id: # AI! Check current_run_id before publishing RunFinishedEvent
-            finish_event = ag_ui_events.RunFinishedEvent(thread_id=self.slug, run_id=self._current_run_id) # AI! thread_id is slug
-            await self.event_bus.publish(topic="ag_ui.run.finished", event_data=finish_event.model_dump(mode='json'))
-            await self.event_bus.unsubscribe(topic_pattern="ag_ui.messages.snapshot", handler_coroutine=self.handle_message_snapshot)
-            logger.info(f"ComposerAgent '{self.slug}' finished run {self._current_run_id} and unsubscribed from MessagesSnapshotEvent.")
+        run_id = self._current_run_id
+        if run_id: # AI! Check current_run_id before publishing RunFinishedEvent
+            # Cleared before awaiting, so a snapshot dispatched meanwhile cannot finish the same run twice
             self._current_run_id = None
+            finish_event = ag_ui_events.RunFinishedEvent(type=ag_ui_events.EventType.RUN_FINISHED, thread_id=self.slug, run_id=run_id) # AI! thread_id is slug
+            await self.event_bus.publish(topic="ag_ui.run.finished", event_data=finish_event.model_dump(mode='json'))
+            logger.info(f"ComposerAgent '{self.slug}' finished run {run_id}.")
 
 
     async def _do_help(self, parent_message_id: Optional[str] = None):
-        help_text = f"""--- {self.slug} Agent Help ---
-The Composer Agent is responsible for composing complex prompts or documents.
-Currently, it will echo any input received.
-Configuration:
-  LLM Profile: {self.llm_profile}
-  Style Guide: {self.style_guide}
+        await self._publish_text_message(content=self._help_text, parent_message_id=parent_message_id)
 
-Global commands (start with /) are handled by the application core.
-"""
-        await self._publish_text_message(content=help_text, parent_message_id=parent_message_id)
+    # Casefolded command word -> unbound handler, dispatched with a single dict lookup
+    _COMMANDS: Dict[str, Callable[..., Awaitable[None]]] = {
+        _HELP: _do_help,
+        sys.intern("h"): _do_help,
+        sys.intern("?"): _do_help,
+    }
 
     # Required PocketFlow AsyncNode methods
     async def activate(self) -> None: # PocketFlow's activate, distinct from on_agent_activate
@@ -176,14 +247,14 @@ Global commands (start with /) are handled by the application core.
              # AI! Ensure AgentLifecycleEvent subscription is made if not already active
              # This might be redundant if on_agent_activate is always called first by an external AgentLifecycleEvent
              # However, keeping it ensures the node can be activated independently by PocketFlow if needed.
-             await self.event_bus.subscribe(topic_pattern="AgentLifecycleEvent", handler_coroutine=self.handle_lifecycle_event)
+             await self._ensure_lifecycle_subscription()
         logger.info(f"ComposerAgent '{self.slug}' (PocketFlow) activate() called.")
 
 
     async def run(self, input_data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
-        logger.debug(f"ComposerAgent '{self.slug}' run method called. Agent is event-driven.")
+        logger.debug("ComposerAgent '%s' run method called. Agent is event-driven.", self.slug)
         return {"status": f"{self.slug} is event-driven."}
 
     async def _process(self, item: Any = None, flow_state: Optional[Dict[str, Any]] = None) -> Any:
-        logger.debug(f"ComposerAgent '{self.slug}' _process called. Logic is in event handlers.")
+        logger.debug("ComposerAgent '%s' _process called. Logic is in event handlers.", self.slug)
         return None
\ No newline at end of file
@@ -0,0 +1,19 @@
+#%%
+# pocket_commander/core_agents/event_payloads.py
+from typing import Any, Dict
+
+from pocket_commander.utils.ids import fast_uuid4_str
+
+
+def event_payload(template: Dict[str, Any], timestamp: float, **fields: Any) -> Dict[str, Any]:
+    """
+    Copies an event payload template with a fresh event_id, the timestamp and the given field values.
+
+    Templates are the model_dump() of an event validated once at import, so the agents emit
+    fixed-shape events without constructing and dumping a model per event.
+    """
+    payload = template.copy()
+    payload["event_id"] = fast_uuid4_str()
+    payload["timestamp"] = timestamp
+    payload.update(fields)
+    return payload
@@ -0,0 +1,45 @@
+#%%
+# pocket_commander/core_agents/lifecycle.py
+import logging
+from typing import Dict, Tuple
+
+from pydantic import TypeAdapter
+
+from pocket_commander.events import AgentLifecycleEvent
+
+logger = logging.getLogger(__name__)
+
+# Built once at import rather than AgentLifecycleEvent.model_validate per event
+_LIFECYCLE_ADAPTER: TypeAdapter[AgentLifecycleEvent] = TypeAdapter(AgentLifecycleEvent)
+
+
+class AgentLifecycleMixin:
+    """
+    Shared AgentLifecycleEvent handling for core agents.
+
+    The agent provides `slug`, `_is_active`, `on_agent_activate()` and `on_agent_deactivate()`,
+    and registers `handle_lifecycle_event` with `event_bus.register_lifecycle(slug, ...)`.
+    """
+
+    __slots__ = () # Keeps __slots__ on agent classes effective
+
+    # lifecycle_type -> (required _is_active state, handler method name)
+    _LIFECYCLE_HANDLERS: Dict[str, Tuple[bool, str]] = {
+        "activating": (False, "on_agent_activate"),
+        "deactivating": (True, "on_agent_deactivate"),
+    }
+
+    async def handle_lifecycle_event(self, topic: str, event_data: dict) -> None:
+        # The bus already routes by agent_name; this raw check covers handlers subscribed directly
+        agent_name = event_data.get("agent_name")
+        if agent_name is None:
+            agent_name = event_data.get("agentName") # Payloads dumped by alias
+        if agent_name != self.slug:
+            return
+        try:
+            event = _LIFECYCLE_ADAPTER.validate_python(event_data)
+            lifecycle_handler = self._LIFECYCLE_HANDLERS.get(event.lifecycle_type)
+            if lifecycle_handler and self._is_active == lifecycle_handler[0]:
+                await getattr(self, lifecycle_handler[1])()
+        except Exception as e:
+            logger.error(f"Error processing AgentLifecycleEvent for '{self.slug}' from topic '{topic}': {e}", exc_info=True)
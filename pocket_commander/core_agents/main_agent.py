@@ -1,15 +1,19 @@
 import asyncio
+import collections
+import functools
 import logging
-import uuid
-import json # For tool call arguments
-from typing import Dict, Any, Optional, List
+import sys
+import time
+from typing import Awaitable, Callable, Deque, Dict, Any, Optional, List, Set, Tuple, Type
 
 from pocket_commander.pocketflow.base import AsyncNode
 from pocket_commander.types import AppServices, AgentConfig
 from pocket_commander.event_bus import ZeroMQEventBus
-from pocket_commander.events import AgentLifecycleEvent # Internal lifecycle event
+from pocket_commander.core_agents.lifecycle import AgentLifecycleMixin # Shared AgentLifecycleEvent handling
+from pocket_commander.core_agents.event_payloads import event_payload # Shared payload template copying
 from pocket_commander.ag_ui import events as ag_ui_events
 from pocket_commander.ag_ui import types as ag_ui_types
+from pocket_commander.utils.ids import fast_uuid4_str # For message IDs
 
 logging.basicConfig(
     level=logging.DEBUG,           # set root level to DEBUG
@@ -19,6 +23,29 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+_EMPTY_ARGS_JSON = "{}" # json.dumps({}) for tool calls without arguments, serialized once
+_MAX_INTERNED_COMMAND_LEN = 32 # Longer words cannot be commands and are not added to the intern table
+
+# EventType members used per message, bound once instead of looked up on the enum class each time
+_TEXT_MESSAGE_START = ag_ui_events.EventType.TEXT_MESSAGE_START
+_TEXT_MESSAGE_CONTENT = ag_ui_events.EventType.TEXT_MESSAGE_CONTENT
+_TEXT_MESSAGE_END = ag_ui_events.EventType.TEXT_MESSAGE_END
+_TOOL_CALL_START = ag_ui_events.EventType.TOOL_CALL_START
+_TOOL_CALL_ARGS = ag_ui_events.EventType.TOOL_CALL_ARGS
+_TOOL_CALL_END = ag_ui_events.EventType.TOOL_CALL_END
+_RUN_FINISHED = ag_ui_events.EventType.RUN_FINISHED
+
+# Message class per role for the agent's own history; other roles fall back to DeveloperMessage
+_ROLE_TO_MESSAGE_CLS: Dict[str, Type[ag_ui_types.BaseMessage]] = {
+    "assistant": ag_ui_types.AssistantMessage,
+    "user": ag_ui_types.UserMessage,
+    "system": ag_ui_types.SystemMessage,
+}
+
+_TIME_TOOL_NAME = "time_tool" # Assuming 'time_tool' is registered globally
+_TIME_TOOL_CONTENT = f"Okay, I will use the '{_TIME_TOOL_NAME}' to get the current time."
+
+@functools.lru_cache(maxsize=None) # EventType is a small closed set; each topic string is built once
 def _get_ag_ui_topic(event_type: ag_ui_events.EventType) -> str:
     """
     Converts an ag_ui EventType enum to a hierarchical topic string.
@@ -35,98 +62,161 @@ def _get_ag_ui_topic(event_type: ag_ui_events.EventType) -> str:
     else:
         # For event types like RAW, CUSTOM that might not have an underscore
         return f"ag_ui.{value_lower}"
-class MainDefaultAgent(AsyncNode):
+
+def _payload_template(event: ag_ui_events.BaseEvent) -> Tuple[str, Dict[str, Any]]:
+    """Validates a fixed-shape event once and returns its topic and model_dump() as a per-call payload base."""
+    return _get_ag_ui_topic(event.type), event.model_dump()
+
+# Emitted events have a fixed shape, so their payloads are built as plain dicts from these templates,
+# matching what model_dump() produces, rather than constructing and dumping a model per event.
+# Text message and tool call events hold only str/float/str-enum fields, so the dicts are already
+# JSON-serializable and the bus encodes them directly. Receivers still validate.
+_TEXT_START_TOPIC, _TEXT_START_PAYLOAD = _payload_template(
+    ag_ui_events.TextMessageStartEvent(type=_TEXT_MESSAGE_START, message_id="", role="assistant"))
+_TEXT_CONTENT_TOPIC, _TEXT_CONTENT_PAYLOAD = _payload_template(
+    ag_ui_events.TextMessageContentEvent(type=_TEXT_MESSAGE_CONTENT, message_id="", delta=" "))
+_TEXT_END_TOPIC, _TEXT_END_PAYLOAD = _payload_template(
+    ag_ui_events.TextMessageEndEvent(type=_TEXT_MESSAGE_END, message_id=""))
+# use_tool_time's tool call events differ per call only in their ids
+_TIME_TOOL_START_TOPIC, _TIME_TOOL_START_PAYLOAD = _payload_template(
+    ag_ui_events.ToolCallStartEvent(type=_TOOL_CALL_START, tool_call_id="", tool_call_name=_TIME_TOOL_NAME, parent_message_id=""))
+_TIME_TOOL_ARGS_TOPIC, _TIME_TOOL_ARGS_PAYLOAD = _payload_template(
+    ag_ui_events.ToolCallArgsEvent(type=_TOOL_CALL_ARGS, tool_call_id="", delta=_EMPTY_ARGS_JSON)) # Time tool takes no arguments
+_TOOL_END_TOPIC, _TOOL_END_PAYLOAD = _payload_template(
+    ag_ui_events.ToolCallEndEvent(type=_TOOL_CALL_END, tool_call_id=""))
+
+class MainDefaultAgent(AgentLifecycleMixin, AsyncNode):
     """
     The main default agent for Pocket Commander.
     Handles basic interactions, provides general information, and can initiate tool calls.
     Interacts via the event bus using ag_ui events and types.
     """
 
+    # Command word -> (handler method name, whether the handler takes the argument string)
+    _DISPATCH: Dict[str, Tuple[str, bool]] = {
+        sys.intern("greet"): ("_do_greet", True),
+        sys.intern("hello"): ("_do_greet", True),
+        sys.intern("agentinfo"): ("_do_agentinfo", False),
+        sys.intern("help"): ("_do_help", False),
+        sys.intern("use_tool_time"): ("_do_use_tool_time", False), # Example command to trigger a tool
+    }
+
     def __init__(self, app_services: AppServices, **init_args: Any):
         super().__init__()
         self.app_services = app_services
         self.event_bus: ZeroMQEventBus = app_services.event_bus # type: ignore
         self.init_args = init_args
-        self.slug = init_args.get("slug", "main")
+        self.slug: str = sys.intern(init_args.get("slug", "main"))
         self.default_greet_name = init_args.get("default_greet_name", "User")
+        # app_core suffixes these topics with the target agent's slug; built once since the slug is fixed
+        self._run_started_topic = f"{_get_ag_ui_topic(ag_ui_events.EventType.RUN_STARTED)}.{self.slug}"
+        self._snapshot_topic = f"{_get_ag_ui_topic(ag_ui_events.EventType.MESSAGES_SNAPSHOT)}.{self.slug}"
         self._is_active = False
         self._current_run_id: Optional[str] = None # To associate messages with a run
-        self._message_history: List[ag_ui_types.Message] = [] # Simple in-memory history for this agent
+        # Simple in-memory history for this agent, bounded FIFO: the oldest messages drop off once history_max is reached
+        self._message_history: Deque[ag_ui_types.Message] = collections.deque(maxlen=init_args.get("history_max", 256))
+        self._background_tasks: Set[asyncio.Task] = set() # Strong refs: the loop only keeps weak refs to tasks
+        # The slug is fixed after init, so the help text is built once
+        self._help_text: str = f"""--- {self.slug} Agent Help ---
+Available inputs:
+  greet [name]         - Greets you or the specified name. (Alias: hello)
+  agentinfo            - Shows information about this agent.
+  use_tool_time        - Example: Calls the 'time_tool' to get current time.
+  help                 - Shows this help message.
+Global commands (start with /) are handled by the application core."""
+        # resolved_agents is filled in when the config is loaded, before any agent is constructed
+        raw_app_config = app_services.raw_app_config
+        resolved_agents = getattr(raw_app_config, 'resolved_agents', {}) if raw_app_config else {}
+        self._resolved_config: Optional[AgentConfig] = resolved_agents.get(self.slug)
+        info_lines = [f"--- Agent: {self.slug} ---"]
+        if self._resolved_config:
+            info_lines.append(f"Description: {self._resolved_config.description}")
+            # ... (add other info as needed)
+        info_lines.append(f"Init Args Received: {self.init_args}")
+        self._agent_info_text = "\n".join(info_lines) # Constant for the agent's lifetime; _do_agentinfo only publishes it
+        self._active_subscription_ids: List[str] = [] # Run-started and snapshot subscriptions made by activate()
+        # Command word -> (bound handler, takes argument string), bound once so dispatch is a single dict probe
+        self._cmd_table: Dict[str, Tuple[Callable[..., Awaitable[None]], bool]] = {
+            command: (getattr(self, method_name), takes_arg)
+            for command, (method_name, takes_arg) in self._DISPATCH.items()
+        }
 
         logger.info(f"MainDefaultAgent '{self.slug}' initialized with args: {init_args}")
 
-        if self.event_bus:
-            # Subscribe to internal AgentLifecycleEvent for activation/deactivation
-            asyncio.create_task(self.event_bus.subscribe("AgentLifecycleEvent", self._handle_internal_lifecycle_event_adapter))
-            logger.info(f"MainDefaultAgent '{self.slug}': Subscribed to internal AgentLifecycleEvent.")
-            # We will subscribe to ag_ui_events.MessagesSnapshotEvent when a run starts
-        else:
+        if not self.event_bus:
             logger.error(f"MainDefaultAgent '{self.slug}': Event bus not available in __init__.")
 
     async def _publish_text_message(self, content: str, role: ag_ui_types.Role, parent_message_id: Optional[str] = None) -> str:
         """Helper to publish a complete text message sequence."""
-        message_id = str(uuid.uuid4())
+        message_id = fast_uuid4_str()
         
-        # Create the message object for internal history
-        common_message_args = {"id": message_id, "role": role, "content": content}
-        if role == "assistant":
-            new_message = ag_ui_types.AssistantMessage(**common_message_args) # type: ignore
-        elif role == "user":
-            new_message = ag_ui_types.UserMessage(**common_message_args) # type: ignore
-        elif role == "system":
-            new_message = ag_ui_types.SystemMessage(**common_message_args) # type: ignore
+        # Create the message object for internal history. The message and event fields below are built here
+        # from a fresh id, a role matching the class, and str content, so model_construct skips re-validating them.
+        message_cls = _ROLE_TO_MESSAGE_CLS.get(role)
+        if message_cls is not None:
+            new_message = message_cls.model_construct(id=message_id, role=role, content=content)
         else: # Fallback, though ideally roles are specific
             new_message = ag_ui_types.DeveloperMessage(id=message_id, role="developer", content=f"Message with role {role}: {content}")
 
         self._message_history.append(new_message)
 
-        start_event = ag_ui_events.TextMessageStartEvent(type=ag_ui_events.EventType.TEXT_MESSAGE_START, message_id=message_id, role=role)
-        await self.event_bus.publish(_get_ag_ui_topic(start_event.type), start_event.model_dump(mode="json"))
+        # Payloads are built from the module-level templates; the sequence goes out through one
+        # publish_many call instead of awaiting each publish in turn.
+        now = time.time()
+        payloads: List[Tuple[str, Dict[str, Any]]] = [
+            (_TEXT_START_TOPIC, event_payload(_TEXT_START_PAYLOAD, now, message_id=message_id, role=role))
+        ]
         if content: # Only send content event if there is content
-            content_event = ag_ui_events.TextMessageContentEvent(type=ag_ui_events.EventType.TEXT_MESSAGE_CONTENT, message_id=message_id, delta=content)
-            await self.event_bus.publish(_get_ag_ui_topic(content_event.type), content_event.model_dump(mode="json"))
-        end_event = ag_ui_events.TextMessageEndEvent(type=ag_ui_events.EventType.TEXT_MESSAGE_END, message_id=message_id)
-        await self.event_bus.publish(_get_ag_ui_topic(end_event.type), end_event.model_dump(mode="json"))
-
-    async def _handle_internal_lifecycle_event_adapter(self, topic: str, data: dict):
-        logger.debug(f"MainDefaultAgent '{self.slug}' received raw lifecycle event on topic '{topic}': {data}")
-        try:
-            event = AgentLifecycleEvent.model_validate(data)
-            await self.handle_internal_lifecycle_event(event)
-        except Exception as e:
-            logger.error(f"Error processing AgentLifecycleEvent from topic '{topic}': {e}", exc_info=True)
-
-    async def handle_internal_lifecycle_event(self, event: AgentLifecycleEvent):
-        logger.debug(f"MainDefaultAgent '{self.slug}' received internal AgentLifecycleEvent: {event.lifecycle_type} for agent '{event.agent_name}'")
-        if event.agent_name == self.slug:
-            if event.lifecycle_type == "activating" and not self._is_active:
-                await self.on_agent_activate()
-            elif event.lifecycle_type == "deactivating" and self._is_active:
-                await self.on_agent_deactivate()
+            payloads.append((_TEXT_CONTENT_TOPIC, event_payload(_TEXT_CONTENT_PAYLOAD, now, message_id=message_id, delta=content)))
+        payloads.append((_TEXT_END_TOPIC, event_payload(_TEXT_END_PAYLOAD, now, message_id=message_id)))
+        await self.event_bus.publish_many(payloads)
+        return message_id
+
+    def _run_in_background(self, coro: Awaitable[Any]) -> None:
+        """Schedules a fire-and-forget coroutine, keeping it referenced until done and logging any failure."""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+
+    def _on_background_task_done(self, task: asyncio.Task) -> None:
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"MainDefaultAgent '{self.slug}': background task failed: {task.exception()}", exc_info=task.exception())
 
     async def on_agent_activate(self):
         self._is_active = True
         # We expect a RunStartedEvent to trigger actual message processing subscriptions
         logger.info(f"MainDefaultAgent '{self.slug}' activated. Awaiting RunStartedEvent to begin processing messages.")
-        await self._publish_text_message(
+        # Not awaited: a slow subscriber must not hold up the lifecycle transition
+        self._run_in_background(self._publish_text_message(
             content=f"Welcome! Main Agent '{self.slug}' is active. How can I help?",
             role="assistant"
-        )
+        ))
 
     async def on_agent_deactivate(self):
         self._is_active = False
-        if self._current_run_id: # If a run was active, mark it as finished
-            finished_event = ag_ui_events.RunFinishedEvent(type=ag_ui_events.EventType.RUN_FINISHED, thread_id=self.slug, run_id=self._current_run_id) # Using slug as thread_id for now
-            await self.event_bus.publish(_get_ag_ui_topic(ag_ui_events.EventType.STEP_FINISHED), finished_event.model_dump(mode="json"))
-            self._current_run_id = None
-        
-        # Unsubscribe from message events
-        await self.event_bus.unsubscribe(_get_ag_ui_topic(ag_ui_events.EventType.MESSAGES_SNAPSHOT), self._handle_message_snapshot_adapter)
+        # State is reset before any await; the finish publish and the unsubscribes then run together
+        run_id = self._current_run_id
+        self._current_run_id = None
+        subscription_ids = self._active_subscription_ids
+        self._active_subscription_ids = []
+
+        pending = []
+        if run_id: # If a run was active, mark it as finished
+            finished_event = ag_ui_events.RunFinishedEvent(type=_RUN_FINISHED, thread_id=self.slug, run_id=run_id) # Using slug as thread_id for now
+            pending.append(self.event_bus.publish(_get_ag_ui_topic(ag_ui_events.EventType.STEP_FINISHED), finished_event.model_dump(mode="json")))
+        # Unsubscribe from run and message events, and drop the lifecycle route registered by activate()
+        pending.extend(self.event_bus.unsubscribe(subscription_id) for subscription_id in subscription_ids)
+        pending.append(self.event_bus.unregister_lifecycle(self.slug, self.handle_lifecycle_event))
+        if pending:
+            await asyncio.gather(*pending)
         # Could also unsubscribe from TextMessageEndEvent if we were listening for user messages that way
-        logger.info(f"MainDefaultAgent '{self.slug}' deactivated and unsubscribed from message events.")
+        logger.info(f"MainDefaultAgent '{self.slug}' deactivated and unsubscribed from lifecycle and message events.")
 
     async def _handle_run_started_adapter(self, topic: str, data: dict):
-        logger.debug(f"MainDefaultAgent '{self.slug}' received raw run started event on topic '{topic}': {data}")
+        if not self._is_active: # Rejected before logging and validation; handle_run_started would ignore it
+            return
+        logger.debug("MainDefaultAgent '%s' received raw run started event on topic '%s': %s", self.slug, topic, data)
         try:
             event = ag_ui_events.RunStartedEvent.model_validate(data)
             await self.handle_run_started(event)
@@ -139,13 +229,14 @@ class MainDefaultAgent(AsyncNode):
             return
         
         self._current_run_id = event.run_id
-        self._message_history = [] # Clear history for the new run
-        logger.info(f"MainDefaultAgent '{self.slug}' received RunStartedEvent (ID: {event.run_id}). Subscribing to MessagesSnapshotEvent.")
-        # Subscribe to MessagesSnapshotEvent to get the initial context for this run
-        await self.event_bus.subscribe(_get_ag_ui_topic(ag_ui_events.EventType.MESSAGES_SNAPSHOT), self._handle_message_snapshot_adapter)
+        self._message_history.clear() # Clear history for the new run
+        # The MessagesSnapshotEvent handler stays subscribed from activate(); setting the run ID is what lets it through
+        logger.info(f"MainDefaultAgent '{self.slug}' received RunStartedEvent (ID: {event.run_id}).")
 
     async def _handle_message_snapshot_adapter(self, topic: str, data: dict):
-        logger.debug(f"MainDefaultAgent '{self.slug}' received raw message snapshot on topic '{topic}': {data}")
+        if not self._is_active or not self._current_run_id: # Rejected before logging and validation
+            return
+        logger.debug("MainDefaultAgent '%s' received raw message snapshot on topic '%s': %s", self.slug, topic, data)
         try:
             event = ag_ui_events.MessagesSnapshotEvent.model_validate(data)
             await self.handle_message_snapshot(event)
@@ -158,49 +249,54 @@ class MainDefaultAgent(AsyncNode):
             logger.debug("MainAgent not active or no current run, ignoring message snapshot.")
             return
 
-        self._message_history.extend(event.messages)
-        
         # For this agent, we'll assume the last message is the one to process.
         # More complex agents might look at the whole thread.
         last_message = event.messages[-1] if event.messages else None
+        if last_message is not None: # Only the processed message is kept; the rest of the snapshot is never read
+            self._message_history.append(last_message)
 
         if last_message and last_message.role == "user" and isinstance(last_message.content, str):
             raw_text = last_message.content.strip()
-            logger.debug(f"MainDefaultAgent '{self.slug}' processing user message (ID: {last_message.id}): '{raw_text}'")
+            logger.debug("MainDefaultAgent '%s' processing user message (ID: %s): '%s'", self.slug, last_message.id, raw_text)
             
-            # Simple command parsing for this example agent
-            parts = raw_text.lower().split(" ", 1)
-            command = parts[0]
-            args_str = parts[1] if len(parts) > 1 else ""
-
-            if command == "greet" or command == "hello":
-                name_arg = args_str.strip() if args_str else None
-                await self._do_greet(name_arg, parent_message_id=last_message.id)
-            elif command == "agentinfo":
-                await self._do_agentinfo(parent_message_id=last_message.id)
-            elif command == "help":
-                await self._do_help(parent_message_id=last_message.id)
-            elif command == "use_tool_time": # Example command to trigger a tool
-                await self._do_use_tool_time(parent_message_id=last_message.id)
+            # Simple command parsing for this example agent. Only the command word is sliced out and
+            # lowercased; the argument tail is copied only for a command that takes it, so long pasted
+            # input is never copied or lowercased as a whole. Arguments such as a greet name keep their case.
+            space_index = raw_text.find(" ")
+            command_end = space_index if space_index != -1 else len(raw_text)
+            dispatch = None
+            if command_end <= _MAX_INTERNED_COMMAND_LEN: # Longer words cannot be commands
+                command = sys.intern(raw_text[:command_end].lower()) # Lets the lookup match interned keys by identity
+                dispatch = self._cmd_table.get(command)
+
+            if dispatch is None:
+                await self._do_unknown(raw_text, parent_message_id=last_message.id)
             else:
-                await self._publish_text_message(
-                    content=f"'{raw_text}' is not a recognized command for the Main Agent. Try 'help'.",
-                    role="assistant",
-                    parent_message_id=last_message.id
-                )
+                handler, takes_arg = dispatch
+                if takes_arg:
+                    await handler(raw_text[command_end + 1:].strip() or None, parent_message_id=last_message.id)
+                else:
+                    await handler(parent_message_id=last_message.id)
         else:
-            logger.debug(f"MainDefaultAgent '{self.slug}' received message snapshot, but no user message to process or content is not string.")
+            logger.debug("MainDefaultAgent '%s' received message snapshot, but no user message to process or content is not string.", self.slug)
 
         # Once processed, this agent considers its part of the run finished for this input.
         # More complex agents might have multiple steps.
-        if self._current_run_id:
-            finished_event = ag_ui_events.RunFinishedEvent(type=ag_ui_events.EventType.RUN_FINISHED, thread_id=self.slug, run_id=self._current_run_id)
+        # The run ID is taken and cleared before awaiting, so a deactivation during the publish cannot finish it again
+        run_id = self._current_run_id
+        self._current_run_id = None # Reset for the next run; snapshots are ignored until the next RunStartedEvent
+        if run_id:
+            finished_event = ag_ui_events.RunFinishedEvent(type=_RUN_FINISHED, thread_id=self.slug, run_id=run_id)
             await self.event_bus.publish(_get_ag_ui_topic(ag_ui_events.EventType.STEP_FINISHED), finished_event.model_dump(mode="json"))
-            self._current_run_id = None # Reset for the next run
-            # Unsubscribe from MessagesSnapshotEvent until the next RunStartedEvent
-            await self.event_bus.unsubscribe(_get_ag_ui_topic(ag_ui_events.EventType.MESSAGES_SNAPSHOT), self._handle_message_snapshot_adapter)
-            logger.info(f"MainDefaultAgent '{self.slug}' finished processing run {self._current_run_id} and unsubscribed from MessagesSnapshotEvent.")
+            logger.info(f"MainDefaultAgent '{self.slug}' finished processing run {run_id}.")
+
 
+    async def _do_unknown(self, raw_text: str, parent_message_id: str):
+        await self._publish_text_message(
+            content=f"'{raw_text}' is not a recognized command for the Main Agent. Try 'help'.",
+            role="assistant",
+            parent_message_id=parent_message_id
+        )
 
     async def _do_greet(self, name_arg: Optional[str], parent_message_id: str):
         name_to_greet = name_arg if name_arg else self.default_greet_name
@@ -211,91 +307,75 @@ class MainDefaultAgent(AsyncNode):
         )
 
     async def _do_agentinfo(self, parent_message_id: str):
-        my_resolved_config: Optional[AgentConfig] = self.app_services.raw_app_config.get('resolved_agents', {}).get(self.slug)
-        info_lines = [f"--- Agent: {self.slug} ---"]
-        if my_resolved_config:
-            info_lines.append(f"Description: {my_resolved_config.description}")
-            # ... (add other info as needed)
-        info_lines.append(f"Init Args Received: {self.init_args}")
-        await self._publish_text_message("\n".join(info_lines), role="assistant", parent_message_id=parent_message_id)
+        await self._publish_text_message(self._agent_info_text, role="assistant", parent_message_id=parent_message_id)
 
     async def _do_help(self, parent_message_id: str):
-        help_text = f"""--- {self.slug} Agent Help ---
-Available inputs:
-  greet [name]         - Greets you or the specified name. (Alias: hello)
-  agentinfo            - Shows information about this agent.
-  use_tool_time        - Example: Calls the 'time_tool' to get current time.
-  help                 - Shows this help message.
-Global commands (start with /) are handled by the application core."""
-        await self._publish_text_message(help_text, role="assistant", parent_message_id=parent_message_id)
+        await self._publish_text_message(self._help_text, role="assistant", parent_message_id=parent_message_id)
 
     async def _do_use_tool_time(self, parent_message_id: str):
         """Example of initiating a tool call."""
-        tool_name = "time_tool" # Assuming 'time_tool' is registered globally
-        tool_call_id = str(uuid.uuid4())
-        assistant_message_id = str(uuid.uuid4())
+        tool_call_id = fast_uuid4_str()
+        assistant_message_id = fast_uuid4_str()
 
         # 1. Construct AssistantMessage with ToolCall
         tool_call = ag_ui_types.ToolCall(
             id=tool_call_id,
             type="function", # Currently only "function" is supported by ag_ui_types.ToolCall
             function=ag_ui_types.FunctionCall(
-                name=tool_name,
-                arguments=json.dumps({}) # Time tool might not need arguments
+                name=_TIME_TOOL_NAME,
+                arguments=_EMPTY_ARGS_JSON # Time tool might not need arguments
             )
         )
         assistant_message_with_tool_call = ag_ui_types.AssistantMessage(
             id=assistant_message_id,
             role="assistant",
-            content=f"Okay, I will use the '{tool_name}' to get the current time.",
+            content=_TIME_TOOL_CONTENT,
             tool_calls=[tool_call]
         )
         self._message_history.append(assistant_message_with_tool_call)
 
-        # 2. Publish events for the AssistantMessage (text part)
-        text_start_event = ag_ui_events.TextMessageStartEvent(type=ag_ui_events.EventType.TEXT_MESSAGE_START, message_id=assistant_message_id, role="assistant")
-        await self.event_bus.publish(_get_ag_ui_topic(text_start_event.type), text_start_event.model_dump(mode="json"))
-        if assistant_message_with_tool_call.content:
-            text_content_event = ag_ui_events.TextMessageContentEvent(type=ag_ui_events.EventType.TEXT_MESSAGE_CONTENT, message_id=assistant_message_id, delta=assistant_message_with_tool_call.content)
-            await self.event_bus.publish(_get_ag_ui_topic(text_content_event.type), text_content_event.model_dump(mode="json"))
-        text_end_event = ag_ui_events.TextMessageEndEvent(type=ag_ui_events.EventType.TEXT_MESSAGE_END, message_id=assistant_message_id)
-        await self.event_bus.publish(_get_ag_ui_topic(text_end_event.type), text_end_event.model_dump(mode="json"))
-        
-        # 3. Publish events for the ToolCall itself
-        tool_call_start_event = ag_ui_events.ToolCallStartEvent(
-            type=ag_ui_events.EventType.TOOL_CALL_START,
-            tool_call_id=tool_call.id,
-            tool_name=tool_call.function.name, # type: ignore
-            parent_message_id=assistant_message_id
-        )
-        await self.event_bus.publish(_get_ag_ui_topic(tool_call_start_event.type), tool_call_start_event.model_dump(mode="json"))
-        
-        # Stream arguments (even if empty JSON string for this tool)
-        tool_call_args_event = ag_ui_events.ToolCallArgsEvent(type=ag_ui_events.EventType.TOOL_CALL_ARGS, tool_call_id=tool_call.id, delta=tool_call.function.arguments) # type: ignore
-        await self.event_bus.publish(_get_ag_ui_topic(tool_call_args_event.type), tool_call_args_event.model_dump(mode="json"))
-        
-        tool_call_end_event = ag_ui_events.ToolCallEndEvent(type=ag_ui_events.EventType.TOOL_CALL_END, tool_call_id=tool_call.id)
-        await self.event_bus.publish(_get_ag_ui_topic(tool_call_end_event.type), tool_call_end_event.model_dump(mode="json"))
+        # 2. Events for the AssistantMessage (text part), then 3. events for the ToolCall itself,
+        # built from the module-level payload templates with this call's ids
+        now = time.time()
+        payloads: List[Tuple[str, Dict[str, Any]]] = [
+            (_TEXT_START_TOPIC, event_payload(_TEXT_START_PAYLOAD, now, message_id=assistant_message_id, role="assistant")),
+            (_TEXT_CONTENT_TOPIC, event_payload(_TEXT_CONTENT_PAYLOAD, now, message_id=assistant_message_id, delta=_TIME_TOOL_CONTENT)),
+            (_TEXT_END_TOPIC, event_payload(_TEXT_END_PAYLOAD, now, message_id=assistant_message_id)),
+            (_TIME_TOOL_START_TOPIC, event_payload(_TIME_TOOL_START_PAYLOAD, now, tool_call_id=tool_call_id, parent_message_id=assistant_message_id)),
+            (_TIME_TOOL_ARGS_TOPIC, event_payload(_TIME_TOOL_ARGS_PAYLOAD, now, tool_call_id=tool_call_id)),
+            (_TOOL_END_TOPIC, event_payload(_TOOL_END_PAYLOAD, now, tool_call_id=tool_call_id)),
+        ]
+
+        # All six events go out in order through a single publish_many call
+        await self.event_bus.publish_many(payloads)
         
-        logger.info(f"MainAgent initiated tool call for '{tool_name}' (ID: {tool_call_id}), part of AssistantMessage (ID: {assistant_message_id}).")
+        logger.info(f"MainAgent initiated tool call for '{_TIME_TOOL_NAME}' (ID: {tool_call_id}), part of AssistantMessage (ID: {assistant_message_id}).")
         # The actual execution is now expected to be handled by ToolAgent via InternalExecuteToolRequest
         # or by app_core listening to ToolCallEndEvent and then publishing InternalExecuteToolRequest.
 
     # Required PocketFlow AsyncNode methods
     async def activate(self) -> None:
         """
-        Called by AgentResolver. Sets up subscriptions for agent lifecycle.
-        Actual message processing subscriptions happen on RunStartedEvent.
+        Called by AgentResolver. Sets up the lifecycle route and subscriptions for run start and message snapshots.
+        All stay registered until deactivation; snapshots are only processed while a run is current.
         """
+        # Registered here rather than in __init__ so on_agent_deactivate can remove it again.
+        # app_core publishes the 'activating' event after activate() returns, so it is not missed.
+        await self.event_bus.register_lifecycle(self.slug, self.handle_lifecycle_event)
         # Subscribing to RunStartedEvent to know when to expect messages for a new interaction
-        await self.event_bus.subscribe(_get_ag_ui_topic(ag_ui_events.EventType.RUN_STARTED), self._handle_run_started_adapter)
-        logger.info(f"MainDefaultAgent '{self.slug}' activate() called. Subscribed to RunStartedEvent.")
-        # The internal AgentLifecycleEvent subscription is already done in __init__
+        # app_core suffixes run topics with the target agent's slug, so ZeroMQ drops other agents' runs
+        # Subscribed once rather than per run, avoiding a subscribe/unsubscribe round trip on every input.
+        # Registration never awaits, so both use subscribe_nowait rather than scheduling two coroutines.
+        self._active_subscription_ids = [
+            self.event_bus.subscribe_nowait(self._run_started_topic, self._handle_run_started_adapter),
+            self.event_bus.subscribe_nowait(self._snapshot_topic, self._handle_message_snapshot_adapter),
+        ]
+        logger.info(f"MainDefaultAgent '{self.slug}' activate() called. Subscribed to AgentLifecycleEvent, RunStartedEvent and MessagesSnapshotEvent.")
 
     async def run(self, input_data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
-        logger.debug(f"MainDefaultAgent '{self.slug}' run method called. Agent is event-driven via activate().")
+        logger.debug("MainDefaultAgent '%s' run method called. Agent is event-driven via activate().", self.slug)
         return {"status": f"{self.slug} is event-driven."}
 
     async def _process(self, item: Any = None, flow_state: Optional[Dict[str, Any]] = None) -> Any:
-        logger.debug(f"MainDefaultAgent '{self.slug}' _process called. Logic is in event handlers.")
+        logger.debug("MainDefaultAgent '%s' _process called. Logic is in event handlers.", self.slug)
         return None
\ No newline at end of file
@@ -13,6 +13,12 @@ from pocket_commander.ag_ui import types as ag_ui_types # Not directly used for
 from pocket_commander.ag_ui import events as ag_ui_events
 from pocket_commander.events import AgentLifecycleEvent, InternalExecuteToolRequest # Keep internal AgentLifecycleEvent
 
+try:
+    import orjson # Optional: parses tool arguments in C, several times faster than json.loads
+    _loads_json = orjson.loads # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _loads_json = json.loads
+
 class ToolAgent(AsyncNode):
     """
     An agent specialized for executing tools based on InternalExecuteToolRequest events.
@@ -36,7 +42,7 @@ class ToolAgent(AsyncNode):
         event = InternalExecuteToolRequest.model_validate(event_data)
         
         if not self.is_active:
-            self.logger.debug(f"ToolAgent '{self.slug}' is not active, ignoring InternalExecuteToolRequest for tool '{event.tool_name}'.")
+            self.logger.debug("ToolAgent '%s' is not active, ignoring InternalExecuteToolRequest for tool '%s'.", self.slug, event.tool_name)
             return
 
         self.logger.info(f"Received InternalExecuteToolRequest (topic: {topic}) for tool '{event.tool_name}' (ID: {event.tool_call_id})")
@@ -74,11 +80,11 @@ class ToolAgent(AsyncNode):
             arguments_dict: Dict[str, Any] = {}
             if event.arguments_json:
                 try:
-                    arguments_dict = json.loads(event.arguments_json)
+                    arguments_dict = _loads_json(event.arguments_json)
                 except json.JSONDecodeError as e:
                     raise ValueError(f"Failed to parse arguments JSON for tool '{event.tool_name}': {e}")
             
-            self.logger.debug(f"Executing tool '{event.tool_name}' with arguments: {arguments_dict}")
+            self.logger.debug("Executing tool '%s' with arguments: %s", event.tool_name, arguments_dict)
             
             if hasattr(tool, 'execute_async') and callable(tool.execute_async):
                 execution_result = await tool.execute_async(**arguments_dict)
@@ -90,7 +96,7 @@ class ToolAgent(AsyncNode):
                 raise TypeError(f"Tool '{event.tool_name}' is not callable and lacks an 'execute' or 'execute_async' method.")
 
             tool_result_content = str(execution_result) 
-            self.logger.info(f"Tool '{event.tool_name}' executed successfully. Result: {tool_result_content[:100]}...")
+            self.logger.info("Tool '%s' executed successfully. Result: %.100s...", event.tool_name, tool_result_content)
 
         except Exception as e:
             error_occurred = True
@@ -134,7 +140,7 @@ class ToolAgent(AsyncNode):
             topic="ag_ui.text_message.end",
             event_data=text_msg_end_event.model_dump(mode='json')
         )
-        self.logger.debug(f"Published TextMessage events for ToolMessage ID {tool_message_id} (Tool Call ID: {event.tool_call_id})")
+        self.logger.debug("Published TextMessage events for ToolMessage ID %s (Tool Call ID: %s)", tool_message_id, event.tool_call_id)
 
         # 4. Publish ToolCallEndEvent
         tool_call_end_event = ag_ui_events.ToolCallEndEvent(tool_call_id=event.tool_call_id)
@@ -142,14 +148,17 @@ class ToolAgent(AsyncNode):
             topic="ag_ui.tool_call.end",
             event_data=tool_call_end_event.model_dump(mode='json')
         )
-        self.logger.debug(f"Published ToolCallEndEvent for Tool Call ID: {event.tool_call_id}")
+        self.logger.debug("Published ToolCallEndEvent for Tool Call ID: %s", event.tool_call_id)
 
 
     async def _handle_agent_lifecycle(self, topic: str, event_data: dict) -> None:
-        event = AgentLifecycleEvent.model_validate(event_data)
-        
-        if event.agent_name != self.slug:
+        # Events for other agents are rejected on the raw dict, before validation
+        agent_name = event_data.get("agent_name")
+        if agent_name is None:
+            agent_name = event_data.get("agentName") # Payloads dumped by alias
+        if agent_name != self.slug:
             return
+        event = AgentLifecycleEvent.model_validate(event_data)
 
         if event.lifecycle_type == "activating":
             if not self.is_active:
@@ -177,7 +186,7 @@ class ToolAgent(AsyncNode):
                     event_data=end_event.model_dump(mode='json')
                 )
             else:
-                self.logger.debug(f"ToolAgent '{self.slug}' received 'activating' lifecycle event but was already active.")
+                self.logger.debug("ToolAgent '%s' received 'activating' lifecycle event but was already active.", self.slug)
 
         elif event.lifecycle_type == "deactivating":
             if self.is_active:
@@ -205,30 +214,27 @@ class ToolAgent(AsyncNode):
                     event_data=end_event.model_dump(mode='json')
                 )
             else:
-                self.logger.debug(f"ToolAgent '{self.slug}' received 'deactivating' lifecycle event but was already inactive.")
+                self.logger.debug("ToolAgent '%s' received 'deactivating' lifecycle event but was already inactive.", self.slug)
 
 
     async def activate(self) -> None:
         """Activates the agent, primarily subscribing to lifecycle events."""
-        await self.app_services.event_bus.subscribe(
-            topic_pattern=AgentLifecycleEvent.__name__, 
-            handler_coroutine=self._handle_agent_lifecycle
-        )
-        self.logger.info(f"ToolAgent '{self.slug}' subscribed to AgentLifecycleEvent topic '{AgentLifecycleEvent.__name__}'. Awaiting activation signal.")
+        await self.app_services.event_bus.register_lifecycle(self.slug, self._handle_agent_lifecycle)
+        self.logger.info(f"ToolAgent '{self.slug}' registered for AgentLifecycleEvent routing. Awaiting activation signal.")
 
     async def run(self, input_data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
         Main execution logic for the node. For ToolAgent, this is primarily event-driven.
         The 'activate' method sets up event subscriptions.
         """
-        self.logger.debug(f"Run method called for ToolAgent '{self.slug}'. Agent is event-driven via activate().")
+        self.logger.debug("Run method called for ToolAgent '%s'. Agent is event-driven via activate().", self.slug)
         return None
 
     async def _process(self, item: Any = None, flow_state: Optional[Dict[str, Any]] = None) -> Any:
         """
         Core processing logic. For ToolAgent, actual work is in event handlers.
         """
-        self.logger.debug(f"_process called for ToolAgent '{self.slug}', but logic is in event handlers.")
+        self.logger.debug("_process called for ToolAgent '%s', but logic is in event handlers.", self.slug)
         return None
 
 # Example of how to register this agent in pocket_commander.conf.yaml:
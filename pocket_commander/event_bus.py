@@ -4,10 +4,33 @@ import asyncio
 import json
 import uuid
 import fnmatch
-from typing import Callable, Coroutine, Any, Optional, Dict, List, Tuple
+import inspect
+import itertools
+from typing import Callable, Any, Optional, Dict, List, Tuple, Type, Union
 
 import zmq
 import zmq.asyncio
+
+try:
+    import orjson # Optional: serializes straight to UTF-8 bytes, several times faster than json.dumps
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _dumps_bytes(event_data: dict) -> bytes:
+        # OPT_NON_STR_KEYS keeps json.dumps' coercion of int/float/bool keys to strings.
+        # orjson.JSONEncodeError subclasses TypeError, so callers see the same exception type.
+        return orjson.dumps(event_data, option=orjson.OPT_NON_STR_KEYS)
+
+    # Parses the received bytes directly, with no intermediate str. orjson.JSONDecodeError subclasses
+    # json.JSONDecodeError and also covers invalid UTF-8, so the receive loop's except clause is unchanged.
+    _loads_bytes = orjson.loads
+else:
+    def _dumps_bytes(event_data: dict) -> bytes:
+        return json.dumps(event_data).encode('utf-8')
+
+    def _loads_bytes(payload_bytes: bytes) -> Any:
+        return json.loads(payload_bytes.decode('utf-8'))
 # import logging # Will add if logging is explicitly requested
 
 # log = logging.getLogger(__name__) # Placeholder for logger
@@ -27,10 +50,13 @@ class ZeroMQEventBus:
     - Client-side custom filter functions for fine-grained event selection.
     - Handler priorities for local subscribers.
     - A "consumed" sentinel to stop event propagation among local handlers.
+    - Per-agent routing of agent lifecycle events through one shared subscription.
     - Communication with a central ZeroMQ broker (XPUB/XSUB pattern assumed).
     """
 
     CONSUMED = object()  # Sentinel to indicate an event has been consumed
+    LIFECYCLE_TOPIC = "AgentLifecycleEvent"  # Topic agents listen on for lifecycle events
+    _RECV_BATCH_MAX = 64  # Messages taken off the SUB socket per receive-loop pass
 
     def __init__(
         self,
@@ -58,10 +84,19 @@ class ZeroMQEventBus:
         self.sub_socket: Optional[zmq.asyncio.Socket] = None
 
         self._subscriptions: Dict[str, Dict[str, Any]] = {}
+        # Dispatch indexes over _subscriptions: patterns without wildcards are looked up by topic,
+        # so only wildcard patterns are fnmatch-ed against each incoming topic.
+        self._exact_subscriptions: Dict[str, Dict[str, Dict[str, Any]]] = {} # topic -> {sub_id: details}
+        self._wildcard_subscriptions: Dict[str, Dict[str, Any]] = {} # sub_id -> details
+        self._subscription_seq = itertools.count() # Keeps equal-priority handlers in subscription order
         self._zmq_topic_prefix_ref_counts: Dict[bytes, int] = {} # For ZMQ-level subscription ref counting
         self._receive_loop_task: Optional[asyncio.Task] = None
         self._running = False
 
+        # agent_name -> lifecycle handlers, served by a single LIFECYCLE_TOPIC subscription
+        self._lifecycle_routes: Dict[str, List[Callable[[str, dict], Any]]] = {}
+        self._lifecycle_subscription_id: Optional[str] = None
+
     async def start(self) -> None:
         """
         Starts the event bus.
@@ -152,7 +187,7 @@ class ZeroMQEventBus:
             raise RuntimeError(f"[{self.identity}] Event bus not started or PUB socket unavailable. Cannot publish.")
 
         try:
-            json_payload_bytes = json.dumps(event_data).encode('utf-8')
+            json_payload_bytes = _dumps_bytes(event_data)
         except TypeError as e:
             # print(f"[{self.identity}] Failed to serialize event_data to JSON for topic '{topic}': {e}")
             raise
@@ -167,6 +202,29 @@ class ZeroMQEventBus:
             raise
 
 
+    async def publish_many(self, events: List[Tuple[str, dict]]) -> None:
+        """
+        Publishes several events in order with a single await.
+
+        All payloads are serialized up front, then every send is queued on the PUB socket
+        back-to-back and awaited together. Each event still travels as its own
+        [topic, payload] message, so subscribers see exactly what `publish` would send.
+
+        Args:
+            events: (topic, event_data) pairs, published in list order.
+
+        Raises:
+            RuntimeError: If the event bus is not started or the PUB socket is not available.
+            TypeError: If any event_data cannot be serialized to JSON (nothing is sent).
+            zmq.ZMQError: For ZeroMQ related errors during send.
+        """
+        if not self._running or not self.pub_socket:
+            raise RuntimeError(f"[{self.identity}] Event bus not started or PUB socket unavailable. Cannot publish.")
+
+        frames = [[topic.encode('utf-8'), _dumps_bytes(event_data)] for topic, event_data in events]
+        if frames:
+            await asyncio.gather(*(self.pub_socket.send_multipart(message_frames) for message_frames in frames))
+
     def _get_broad_zmq_prefix(self, topic_pattern: str) -> str:
         """
         Determines the broadest ZMQ topic prefix for a given fnmatch-style topic pattern.
@@ -186,8 +244,8 @@ class ZeroMQEventBus:
 
     async def subscribe(
         self,
-        topic_pattern: str,
-        handler_coroutine: Callable[[str, dict], Coroutine[Any, Any, Any]],
+        topic_pattern: Union[str, Type[Any]],
+        handler_coroutine: Callable[[str, dict], Any],
         priority: int = 0,
         custom_filter_function: Optional[Callable[[str, dict], bool]] = None,
     ) -> str:
@@ -197,9 +255,12 @@ class ZeroMQEventBus:
         Args:
             topic_pattern: The pattern to match against incoming event topics
                            (e.g., "app.core.*", "app.module.specific_event").
-                           Supports `fnmatch`-style wildcards.
-            handler_coroutine: The asynchronous function to be invoked when an event matches.
+                           Supports `fnmatch`-style wildcards. An event class may be passed
+                           instead and is subscribed by its class name (e.g. `AgentLifecycleEvent`).
+            handler_coroutine: The function to be invoked when an event matches.
                                It will receive `(actual_topic: str, event_data_dict: dict)`.
+                               Plain (non-async) callables are invoked directly without
+                               creating a coroutine; their return value is still checked for CONSUMED.
             priority: An integer indicating the local execution priority for this handler
                       if multiple local handlers match the same event (lower numbers execute first).
             custom_filter_function: An optional callable that receives
@@ -214,9 +275,27 @@ class ZeroMQEventBus:
             RuntimeError: If the event bus is not started or SUB socket is not available
                           (unless only storing subscription and applying on start).
         """
+        return self.subscribe_nowait(topic_pattern, handler_coroutine, priority, custom_filter_function)
+
+    def subscribe_nowait(
+        self,
+        topic_pattern: Union[str, Type[Any]],
+        handler_coroutine: Callable[[str, dict], Any],
+        priority: int = 0,
+        custom_filter_function: Optional[Callable[[str, dict], bool]] = None,
+    ) -> str:
+        """
+        Synchronous form of `subscribe`, taking the same arguments and returning the `subscription_id`.
+
+        Registration never needs to await, so this can be called where awaiting is not possible,
+        such as a constructor. The subscription is in place as soon as the call returns.
+        """
         if not self.sub_socket and self._running: # Check if running but socket somehow not there
              raise RuntimeError(f"[{self.identity}] SUB socket not available. Cannot subscribe at ZMQ level.")
 
+        if isinstance(topic_pattern, type):
+            topic_pattern = topic_pattern.__name__
+
         subscription_id = str(uuid.uuid4())
         
         broad_zmq_prefix_str = self._get_broad_zmq_prefix(topic_pattern)
@@ -228,6 +307,8 @@ class ZeroMQEventBus:
             "priority": priority,
             "custom_filter": custom_filter_function,
             "zmq_prefix_bytes": broad_zmq_prefix_bytes, # Store for unsubscribe
+            "is_exact": broad_zmq_prefix_str == topic_pattern, # No wildcard: matched by topic lookup
+            "seq": next(self._subscription_seq),
         }
 
         current_ref_count = self._zmq_topic_prefix_ref_counts.get(broad_zmq_prefix_bytes, 0)
@@ -241,6 +322,12 @@ class ZeroMQEventBus:
                 raise
         
         self._zmq_topic_prefix_ref_counts[broad_zmq_prefix_bytes] = current_ref_count + 1
+
+        subscription_details = self._subscriptions[subscription_id]
+        if subscription_details["is_exact"]:
+            self._exact_subscriptions.setdefault(topic_pattern, {})[subscription_id] = subscription_details
+        else:
+            self._wildcard_subscriptions[subscription_id] = subscription_details
         
         # print(f"[{self.identity}] Subscribed handler for pattern '{topic_pattern}' (ID: {subscription_id}), ZMQ prefix '{broad_zmq_prefix_str}'")
         return subscription_id
@@ -264,6 +351,15 @@ class ZeroMQEventBus:
             # print(f"[{self.identity}] Unsubscribe failed: No subscription found with ID {subscription_id}")
             return False
 
+        if subscription_details["is_exact"]:
+            exact_topic_subscriptions = self._exact_subscriptions.get(subscription_details["topic_pattern"])
+            if exact_topic_subscriptions is not None:
+                exact_topic_subscriptions.pop(subscription_id, None)
+                if not exact_topic_subscriptions:
+                    del self._exact_subscriptions[subscription_details["topic_pattern"]]
+        else:
+            self._wildcard_subscriptions.pop(subscription_id, None)
+
         broad_zmq_prefix_bytes = subscription_details["zmq_prefix_bytes"]
         current_ref_count = self._zmq_topic_prefix_ref_counts.get(broad_zmq_prefix_bytes, 0)
 
@@ -287,6 +383,124 @@ class ZeroMQEventBus:
         # print(f"[{self.identity}] Unsubscribed handler with ID {subscription_id} (pattern: '{subscription_details['topic_pattern']}')")
         return True
 
+    async def register_lifecycle(self, agent_name: str, handler_coroutine: Callable[[str, dict], Any]) -> None:
+        """
+        Routes lifecycle events for one agent to a handler.
+
+        All lifecycle events arrive through one shared LIFECYCLE_TOPIC subscription, and each
+        event is passed only to the handlers registered for its `agent_name`. Other agents'
+        handlers are never called, so they do not validate events meant for someone else.
+        Registering the same handler for the same agent twice has no effect.
+
+        Args:
+            agent_name: The agent slug whose lifecycle events the handler receives.
+            handler_coroutine: Invoked as `(actual_topic: str, event_data_dict: dict)`, like a
+                               `subscribe` handler.
+        """
+        self.register_lifecycle_nowait(agent_name, handler_coroutine)
+
+    def register_lifecycle_nowait(self, agent_name: str, handler_coroutine: Callable[[str, dict], Any]) -> None:
+        """Synchronous form of `register_lifecycle`, usable where awaiting is not possible."""
+        handlers = self._lifecycle_routes.setdefault(agent_name, [])
+        if handler_coroutine not in handlers:
+            handlers.append(handler_coroutine)
+        if self._lifecycle_subscription_id is None:
+            self._lifecycle_subscription_id = self.subscribe_nowait(self.LIFECYCLE_TOPIC, self._dispatch_lifecycle_event)
+
+    async def unregister_lifecycle(self, agent_name: str, handler_coroutine: Callable[[str, dict], Any]) -> bool:
+        """
+        Removes a handler added with `register_lifecycle`.
+
+        The shared LIFECYCLE_TOPIC subscription is dropped with the last handler.
+
+        Returns:
+            `True` if the handler was registered for `agent_name` and removed, `False` otherwise.
+        """
+        handlers = self._lifecycle_routes.get(agent_name)
+        if not handlers or handler_coroutine not in handlers:
+            return False
+        handlers.remove(handler_coroutine)
+        if not handlers:
+            del self._lifecycle_routes[agent_name]
+        if not self._lifecycle_routes and self._lifecycle_subscription_id is not None:
+            subscription_id, self._lifecycle_subscription_id = self._lifecycle_subscription_id, None
+            await self.unsubscribe(subscription_id)
+        return True
+
+    async def _dispatch_lifecycle_event(self, topic: str, event_data: dict) -> None:
+        """Passes a lifecycle event to the handlers registered for its agent_name only."""
+        agent_name = event_data.get("agent_name")
+        if agent_name is None:
+            agent_name = event_data.get("agentName") # Payloads dumped by alias
+        handlers = self._lifecycle_routes.get(agent_name)
+        if not handlers:
+            return
+        for handler in list(handlers): # list() for safe iteration if a handler unregisters
+            try:
+                result = handler(topic, event_data)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e_handler:
+                # print(f"[{self.identity}] Error in lifecycle handler for agent '{agent_name}': {e_handler}")
+                pass # Continue to other handlers despite one failing
+
+    async def _dispatch_received(self, topic_bytes: bytes, payload_bytes: bytes) -> None:
+        """Decodes one received message and passes it to the matching local handlers in priority order."""
+        try:
+            actual_topic_str = topic_bytes.decode('utf-8')
+            event_data_dict = _loads_bytes(payload_bytes)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            # print(f"[{self.identity}] Failed to decode/deserialize message: {e}. Topic bytes: {topic_bytes}, Payload bytes: {payload_bytes[:100]}...")
+            return # Skip malformed message
+
+        # print(f"[{self.identity}] Received event on topic '{actual_topic_str}': {event_data_dict}")
+
+        matched_handlers: List[Tuple[int, int, Callable, str]] = [] # (priority, seq, handler_coro, sub_id)
+
+        # Exact-topic subscriptions come from a dict lookup; only wildcard patterns need fnmatch
+        exact_topic_subscriptions = self._exact_subscriptions.get(actual_topic_str)
+        candidates = list(exact_topic_subscriptions.items()) if exact_topic_subscriptions else []
+        candidates.extend(
+            (sub_id, details) for sub_id, details in list(self._wildcard_subscriptions.items()) # list() for safe iteration if modified
+            if fnmatch.fnmatch(actual_topic_str, details["topic_pattern"])
+        )
+
+        for sub_id, details in candidates:
+            topic_pattern: str = details["topic_pattern"]
+            custom_filter: Optional[Callable[[str, dict], bool]] = details.get("custom_filter")
+            passes_custom_filter = True
+            if custom_filter:
+                try:
+                    passes_custom_filter = custom_filter(actual_topic_str, event_data_dict)
+                    # print(f"[{self.identity}] Custom filter for sub {sub_id} returned {passes_custom_filter}")
+                except Exception as e_filter:
+                    # print(f"[{self.identity}] Error in custom_filter for subscription {sub_id} (pattern '{topic_pattern}'): {e_filter}")
+                    passes_custom_filter = False # Treat filter error as not passing
+
+            if passes_custom_filter:
+                matched_handlers.append((details["priority"], details["seq"], details["handler"], sub_id))
+        
+        if not matched_handlers:
+            # print(f"[{self.identity}] No local handlers matched for topic '{actual_topic_str}'")
+            return
+
+        # Sort handlers by priority (lower number = higher priority), then by subscription order
+        matched_handlers.sort(key=lambda x: (x[0], x[1]))
+        # print(f"[{self.identity}] Sorted matched handlers for '{actual_topic_str}': {[(p, s_id) for p, _, _, s_id in matched_handlers]}")
+
+        for priority, _seq, handler_coro, sub_id in matched_handlers:
+            try:
+                # print(f"[{self.identity}] Invoking handler (priority {priority}, sub {sub_id}) for topic '{actual_topic_str}'")
+                result = handler_coro(actual_topic_str, event_data_dict)
+                if inspect.isawaitable(result): # Sync handlers skip coroutine creation and scheduling
+                    result = await result
+                if result is self.CONSUMED:
+                    # print(f"[{self.identity}] Event on topic '{actual_topic_str}' consumed by handler for sub {sub_id}. Stopping further local processing.")
+                    break 
+            except Exception as e_handler:
+                # print(f"[{self.identity}] Error in handler for subscription {sub_id} (pattern '{self._subscriptions.get(sub_id, {}).get('topic_pattern')}'): {e_handler}")
+                pass # Continue to other handlers despite one failing
+
     async def _message_receive_loop(self) -> None:
         """
         Internal asyncio task to continuously receive messages from the SUB socket
@@ -295,57 +509,19 @@ class ZeroMQEventBus:
         # print(f"[{self.identity}] Message receiving loop started.")
         while self._running and self.sub_socket:
             try:
-                # print(f"[{self.identity}] Awaiting message from SUB socket...")
-                topic_bytes, json_payload_bytes = await self.sub_socket.recv_multipart()
-                # print(f"[{self.identity}] Received raw message: topic_bytes={topic_bytes}, payload_len={len(json_payload_bytes)}")
-
-                try:
-                    actual_topic_str = topic_bytes.decode('utf-8')
-                    event_data_dict = json.loads(json_payload_bytes.decode('utf-8'))
-                except (UnicodeDecodeError, json.JSONDecodeError) as e:
-                    # print(f"[{self.identity}] Failed to decode/deserialize message: {e}. Topic bytes: {topic_bytes}, Payload bytes: {json_payload_bytes[:100]}...")
-                    continue # Skip malformed message
-
-                # print(f"[{self.identity}] Received event on topic '{actual_topic_str}': {event_data_dict}")
-
-                matched_handlers: List[Tuple[int, Callable, str]] = [] # (priority, handler_coro, sub_id)
-
-                for sub_id, details in list(self._subscriptions.items()): # list() for safe iteration if modified
-                    topic_pattern: str = details["topic_pattern"]
-                    
-                    if fnmatch.fnmatch(actual_topic_str, topic_pattern):
-                        # print(f"[{self.identity}] Topic '{actual_topic_str}' matched pattern '{topic_pattern}' for sub {sub_id}")
-                        custom_filter: Optional[Callable[[str, dict], bool]] = details.get("custom_filter")
-                        passes_custom_filter = True
-                        if custom_filter:
-                            try:
-                                passes_custom_filter = custom_filter(actual_topic_str, event_data_dict)
-                                # print(f"[{self.identity}] Custom filter for sub {sub_id} returned {passes_custom_filter}")
-                            except Exception as e_filter:
-                                # print(f"[{self.identity}] Error in custom_filter for subscription {sub_id} (pattern '{topic_pattern}'): {e_filter}")
-                                passes_custom_filter = False # Treat filter error as not passing
-
-                        if passes_custom_filter:
-                            matched_handlers.append((details["priority"], details["handler"], sub_id))
-                
-                if not matched_handlers:
-                    # print(f"[{self.identity}] No local handlers matched for topic '{actual_topic_str}'")
-                    continue
-
-                # Sort handlers by priority (lower number = higher priority)
-                matched_handlers.sort(key=lambda x: x[0])
-                # print(f"[{self.identity}] Sorted matched handlers for '{actual_topic_str}': {[(p, s_id) for p, _, s_id in matched_handlers]}")
-
-                for priority, handler_coro, sub_id in matched_handlers:
+                # Take over everything already queued on the socket after one awaited receive,
+                # so a burst costs one trip through the event loop rather than one per message
+                received_batch = [await self.sub_socket.recv_multipart()]
+                while len(received_batch) < self._RECV_BATCH_MAX:
                     try:
-                        # print(f"[{self.identity}] Invoking handler (priority {priority}, sub {sub_id}) for topic '{actual_topic_str}'")
-                        result = await handler_coro(actual_topic_str, event_data_dict)
-                        if result is self.CONSUMED:
-                            # print(f"[{self.identity}] Event on topic '{actual_topic_str}' consumed by handler for sub {sub_id}. Stopping further local processing.")
-                            break 
-                    except Exception as e_handler:
-                        # print(f"[{self.identity}] Error in handler for subscription {sub_id} (pattern '{self._subscriptions.get(sub_id, {}).get('topic_pattern')}'): {e_handler}")
-                        pass # Continue to other handlers despite one failing
+                        received_batch.append(self.sub_socket.recv_multipart(flags=zmq.NOBLOCK).result())
+                    except zmq.ZMQError: # zmq.Again once the queue is empty; other errors resurface on the next await
+                        break
+                for frames in received_batch:
+                    if len(frames) != 2: # Not a [topic, payload] message; skip it without losing the rest of the batch
+                        # print(f"[{self.identity}] Skipping message with {len(frames)} frame(s).")
+                        continue
+                    await self._dispatch_received(frames[0], frames[1])
 
             except zmq.ZMQError as e:
                 if e.errno == zmq.ETERM:
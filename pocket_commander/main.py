@@ -1,6 +1,5 @@
 import asyncio
 import logging
-import yaml # For loading configuration
 from typing import Dict, Any, Optional
 import subprocess # For managing the broker process
 import sys # For python executable path
@@ -32,6 +31,10 @@ logging.basicConfig(
 
 async def main():
     print("PRINT: main() function started.", flush=True) # AI! Add print
+    if hasattr(asyncio, "eager_task_factory"): # Python 3.12+
+        # Tasks (agent subscriptions, bus receive loop, UI loops) run inline until their first real
+        # suspension instead of waiting a scheduler round-trip; set before anything is created.
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     bootstrap_logger = logging.getLogger(__name__ + ".bootstrap")
     # bootstrap_logger.info("Initializing Pocket Commander (ZeroMQ Edition)...") # Defer this until after logging is set up
 
@@ -231,6 +234,13 @@ async def main():
 if __name__ == "__main__":
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    else:
+        try:
+            import uvloop # Optional: libuv-backed loop with cheaper socket readiness and task dispatch
+        except ImportError:
+            pass
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     try:
         asyncio.run(main())
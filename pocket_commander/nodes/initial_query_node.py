@@ -6,7 +6,7 @@ logger = logging.getLogger(__name__)
 class InitialQueryNode(AsyncNode):
     def __init__(self, max_retries=2, wait=1): # Default retries/wait for this node type
         super().__init__(max_retries=max_retries, wait=wait)
-        logger.debug(f"InitialQueryNode initialized with max_retries={self.max_retries}, wait={self.wait}s")
+        logger.debug("InitialQueryNode initialized with max_retries=%s, wait=%ss", self.max_retries, self.wait)
 
     async def prep_async(self, shared):
         """
@@ -21,7 +21,7 @@ class InitialQueryNode(AsyncNode):
             # query = "What is the meaning of life?"
             # logger.warning(f"Prep: 'query' not found, using default: '{query}'")
         
-        logger.debug(f"Prep: Initial query retrieved: '{query}'")
+        logger.debug("Prep: Initial query retrieved: '%s'", query)
         return query
 
     async def exec_async(self, prep_res):
@@ -30,7 +30,7 @@ class InitialQueryNode(AsyncNode):
         """
         query = prep_res
         initial_messages = [{'role': 'user', 'content': query}]
-        logger.debug(f"Exec: Prepared initial messages: {initial_messages}")
+        logger.debug("Exec: Prepared initial messages: %s", initial_messages)
         return initial_messages
 
     async def post_async(self, shared, prep_res, exec_res):
@@ -11,8 +11,8 @@ class PrintFinalAnswerNode(AsyncNode):
         self.output_handler = output_handler # Stored output_handler
         self.prints_directly = prints_directly
         logger.debug(
-            f"PrintFinalAnswerNode initialized with max_retries={self.max_retries}, "
-            f"wait={self.wait}s, prints_directly={self.prints_directly}, has_output_handler={self.output_handler is not None}"
+            "PrintFinalAnswerNode initialized with max_retries=%s, wait=%ss, prints_directly=%s, has_output_handler=%s",
+            self.max_retries, self.wait, self.prints_directly, self.output_handler is not None
         )
 
     async def prep_async(self, shared_data: dict):
@@ -21,7 +21,7 @@ class PrintFinalAnswerNode(AsyncNode):
         """
         final_answer = shared_data.get('final_answer', 'Info: No final answer was generated by the previous node.')
         messages = shared_data.get('messages', [])
-        logger.debug(f"Prep: Retrieved final_answer: '{final_answer}'")
+        logger.debug("Prep: Retrieved final_answer: '%s'", final_answer)
         return {"final_answer": final_answer, "messages": messages}
 
     async def exec_async(self, prep_res: dict):
@@ -64,5 +64,5 @@ class PrintFinalAnswerNode(AsyncNode):
         # shared_data['final_answer'] is assumed to be set by an upstream node (e.g., LLMNode).
         # This node's role is presentation or ensuring it's ready for presentation.
 
-        logger.debug(f"Post: Updated messages in shared store: {shared_data['messages']}")
+        logger.debug("Post: Updated messages in shared store: %s", shared_data['messages'])
         return "default" # Standard action to proceed
\ No newline at end of file
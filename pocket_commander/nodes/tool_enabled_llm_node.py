@@ -53,10 +53,10 @@ class ToolEnabledLLMNode(AsyncNode):
             tool_function = tool_def.func # Get the callable from ToolDefinition
             try:
                 if inspect.iscoroutinefunction(tool_function):
-                    logger.debug(f"Tool {tool_name} is a coroutine function. Executing directly.")
+                    logger.debug("Tool %s is a coroutine function. Executing directly.", tool_name)
                     result = await tool_function(**tool_input_dict)
                 else:
-                    logger.debug(f"Tool {tool_name} is a synchronous function. Executing in thread.")
+                    logger.debug("Tool %s is a synchronous function. Executing in thread.", tool_name)
                     result = await asyncio.to_thread(tool_function, **tool_input_dict)
                 logger.info(f"Tool {tool_name} executed successfully. Result: {result}")
                 return str(result) # Ensure result is string for consistent processing
@@ -87,7 +87,7 @@ class ToolEnabledLLMNode(AsyncNode):
         # Ensure the current user query is the last user message if not already part of a sequence
         if not messages or messages[-1].get("role") != "user" or messages[-1].get("content") != query:
             messages.append({"role": "user", "content": query})
-            logger.debug(f"Prep: Added/updated user query to messages list.")
+            logger.debug("Prep: Added/updated user query to messages list.")
         
         logger.info(f"Prep: Prepared messages for query: '{query}'")
         return {"messages": messages, "max_tool_attempts": self.max_tool_attempts}
@@ -114,13 +114,13 @@ Ensure your response for a tool call is ONLY the YAML block, and for a direct an
         current_messages = [msg for msg in initial_messages if msg.get("role") != "system"]
         current_messages.insert(0, {"role": "system", "content": system_prompt_content})
         
-        logger.debug(f"Initial messages for LLM (with system prompt): {current_messages}")
+        logger.debug("Initial messages for LLM (with system prompt): %s", current_messages)
 
         for attempt in range(max_attempts):
             logger.info(f"LLM call attempt {attempt + 1}/{max_attempts}")
             
             response_text = await asyncio.to_thread(self.call_llm_func, current_messages, profile_name=self.llm_profile_name)
-            logger.debug(f"Raw LLM response: \n{response_text}")
+            logger.debug("Raw LLM response: \n%s", response_text)
 
             try:
                 cleaned_response_text = response_text.strip()
@@ -130,9 +130,9 @@ Ensure your response for a tool call is ONLY the YAML block, and for a direct an
                         cleaned_response_text = cleaned_response_text[:-3]
                     cleaned_response_text = cleaned_response_text.strip()
 
-                logger.debug(f"Attempting to parse LLM response as YAML. Cleaned text for YAML load: '{cleaned_response_text}'")
+                logger.debug("Attempting to parse LLM response as YAML. Cleaned text for YAML load: '%s'", cleaned_response_text)
                 tool_call_data = yaml.safe_load(cleaned_response_text)
-                logger.debug(f"Parsed YAML data (tool_call_data): {tool_call_data}")
+                logger.debug("Parsed YAML data (tool_call_data): %s", tool_call_data)
 
                 if isinstance(tool_call_data, dict) and \
                    "tool_call" in tool_call_data and \
@@ -150,7 +150,7 @@ Ensure your response for a tool call is ONLY the YAML block, and for a direct an
 
                     current_messages.append({"role": "assistant", "content": cleaned_response_text}) # LLM's tool request (YAML)
                     current_messages.append({"role": "user", "content": f"Tool '{tool_name}' result: {tool_result}"}) # Simulate tool result as user message
-                    logger.debug(f"Messages after tool execution: {current_messages[-2:]}") # Log last two messages
+                    logger.debug("Messages after tool execution: %s", current_messages[-2:]) # Log last two messages
 
                     if attempt == max_attempts - 1:
                         logger.warning("Max tool attempts reached, LLM still trying to use tools. Forcing final answer generation.")
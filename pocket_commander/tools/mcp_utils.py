@@ -82,6 +82,19 @@ async def mcp_tool_caller(
         # Similar to above, re-raising.
         raise
 
+def get_mcp_tool_pc_name(mcp_server_name: str, mcp_tool_name: str) -> str:
+    """Returns the Pocket Commander tool name used to register an MCP tool."""
+    # Sanitize server and tool names for use in Pocket Commander tool name
+    safe_server_name = mcp_server_name.replace('-', '_').replace('.', '_')
+    safe_tool_name = mcp_tool_name.replace('-', '_').replace('.', '_')
+    
+    # Construct a unique and descriptive name for the tool within Pocket Commander
+    return f"mcp_{safe_server_name}_{safe_tool_name}"
+
+def get_mcp_tool_pc_description(mcp_server_name: str, mcp_tool_description: str) -> str:
+    """Returns the description an MCP tool is registered with, marked as coming from its server."""
+    return f"[MCP Tool on '{mcp_server_name}'] {mcp_tool_description}"
+
 def create_mcp_tool_definition(
     mcp_server_name: str,
     mcp_tool_name: str,
@@ -117,15 +130,10 @@ def create_mcp_tool_definition(
             arguments=kwargs
         )
 
-    # Sanitize server and tool names for use in Pocket Commander tool name
-    safe_server_name = mcp_server_name.replace('-', '_').replace('.', '_')
-    safe_tool_name = mcp_tool_name.replace('-', '_').replace('.', '_')
-    
-    # Construct a unique and descriptive name for the tool within Pocket Commander
-    pc_tool_name = f"mcp_{safe_server_name}_{safe_tool_name}"
+    pc_tool_name = get_mcp_tool_pc_name(mcp_server_name, mcp_tool_name)
     
     # Enhance the description to indicate it's an MCP tool
-    pc_tool_description = f"[MCP Tool on '{mcp_server_name}'] {mcp_tool_description}"
+    pc_tool_description = get_mcp_tool_pc_description(mcp_server_name, mcp_tool_description)
 
     return ToolDefinition(
         name=pc_tool_name,
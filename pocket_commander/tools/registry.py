@@ -1,16 +1,23 @@
+import functools
 import inspect
 import importlib
 import pkgutil
 import os
 import logging # Added
-from typing import Dict, List, Optional, Callable, Any, Union
+from typing import Dict, List, NamedTuple, Optional, Callable, Any, Union
 
 from pocket_commander.tools.definition import ToolDefinition, ToolParameterDefinition
-from pocket_commander.tools.mcp_utils import create_mcp_tool_definition
+from pocket_commander.tools.mcp_utils import create_mcp_tool_definition, get_mcp_tool_pc_description, get_mcp_tool_pc_name
 # from pocket_commander.types import AgentConfig # Not directly needed here, but good for context
 
 logger = logging.getLogger(__name__) # Added
 
+class _LazyTool(NamedTuple):
+    """A registered tool whose ToolDefinition is only built when it is first retrieved."""
+    description: str # Final description, as the built ToolDefinition will carry it
+    parameters: Callable[[], List[ToolParameterDefinition]] # Memoized, so the metadata export and the build parse once
+    build: Callable[[], ToolDefinition]
+
 class ToolRegistry:
     """
     Central class responsible for storing, managing, discovering,
@@ -18,6 +25,7 @@ class ToolRegistry:
     """
     def __init__(self):
         self._tools: Dict[str, ToolDefinition] = {}  # name -> ToolDefinition
+        self._lazy_tools: Dict[str, _LazyTool] = {}  # name -> pending tool, built on first access
 
     def register_tool_definition(self, tool_def: ToolDefinition, allow_override: bool = False):
         """
@@ -29,10 +37,11 @@ class ToolRegistry:
             logger.error(f"Attempted to register an object that is not a ToolDefinition: {tool_def}")
             return
 
-        if not allow_override and tool_def.name in self._tools:
+        if not allow_override and (tool_def.name in self._tools or tool_def.name in self._lazy_tools):
             # Changed print to logger.warning
             logger.warning(f"Tool '{tool_def.name}' already registered. Skipping duplicate registration.")
             return
+        self._lazy_tools.pop(tool_def.name, None)
         self._tools[tool_def.name] = tool_def
         # logger.info(f"Tool '{tool_def.name}' registered.") # Can be verbose
 
@@ -103,46 +112,113 @@ class ToolRegistry:
         # Changed print to logger.info
         logger.info(f"MCP Tool '{tool_def.name}' (from {mcp_server_name}/{mcp_tool_name}) registered.")
 
+    def register_mcp_tool_lazy(
+        self,
+        mcp_server_name: str,
+        mcp_tool_name: str,
+        mcp_tool_description: str,
+        mcp_tool_parameters_factory: Callable[[], List[ToolParameterDefinition]],
+        allow_override: bool = False
+    ):
+        """
+        Registers an MCP tool whose ToolDefinition is only built when the tool is
+        first retrieved with get_tool or list_tools. The LLM metadata export reads
+        the pending entry directly and parses its parameters without building it.
+        """
+        pc_tool_name = get_mcp_tool_pc_name(mcp_server_name, mcp_tool_name)
+        if not allow_override and (pc_tool_name in self._tools or pc_tool_name in self._lazy_tools):
+            logger.warning(f"Tool '{pc_tool_name}' already registered. Skipping duplicate registration.")
+            return
+
+        parameters = functools.cache(mcp_tool_parameters_factory)
+
+        def build_tool_definition() -> ToolDefinition:
+            return create_mcp_tool_definition(
+                mcp_server_name=mcp_server_name,
+                mcp_tool_name=mcp_tool_name,
+                mcp_tool_description=mcp_tool_description,
+                mcp_tool_parameters=parameters()
+            )
+
+        self._tools.pop(pc_tool_name, None)
+        self._lazy_tools[pc_tool_name] = _LazyTool(
+            description=get_mcp_tool_pc_description(mcp_server_name, mcp_tool_description),
+            parameters=parameters,
+            build=build_tool_definition,
+        )
+        logger.info(f"MCP Tool '{pc_tool_name}' (from {mcp_server_name}/{mcp_tool_name}) registered (parameters load on first use).")
+
+    def _materialize_lazy_tool(self, name: str) -> Optional[ToolDefinition]:
+        """Builds a lazily registered tool once and moves it into the regular tool table."""
+        lazy_tool = self._lazy_tools.pop(name, None)
+        if lazy_tool is None:
+            return None
+        try:
+            tool_def = lazy_tool.build()
+        except Exception as e:
+            logger.error(f"Error building lazily registered tool '{name}': {e}", exc_info=True)
+            return None
+        self._tools[name] = tool_def
+        return tool_def
+
     def get_tool(self, name: str) -> Optional[ToolDefinition]:
         """Retrieves a tool by its name."""
-        return self._tools.get(name)
+        tool_def = self._tools.get(name)
+        if tool_def is None and name in self._lazy_tools:
+            tool_def = self._materialize_lazy_tool(name)
+        return tool_def
 
     def list_tools(self) -> List[ToolDefinition]:
-        """Returns a list of all registered tool definitions."""
+        """Returns a list of all registered tool definitions, building any lazily registered ones."""
+        for name in list(self._lazy_tools):
+            self._materialize_lazy_tool(name)
         return list(self._tools.values())
 
     def get_all_tools_metadata_for_llm(self) -> List[Dict[str, Any]]:
         """
         Formats all tool definitions into a list of dictionaries suitable for LLM
         function calling (e.g., OpenAI's format).
+        Lazily registered tools are described from their pending entries and stay unbuilt.
         """
-        llm_tools = []
-        for tool_def in self._tools.values():
-            properties_for_llm = {}
-            required_params = []
-            for p_def in tool_def.parameters:
-                param_details: Dict[str, Any] = {
-                    "type": p_def.type_str,
-                    "description": p_def.description,
-                }
-                properties_for_llm[p_def.name] = param_details
-                if p_def.is_required:
-                    required_params.append(p_def.name)
-            
-            llm_tools.append({
-                "type": "function",
-                "function": {
-                    "name": tool_def.name,
-                    "description": tool_def.description,
-                    "parameters": {
-                        "type": "object",
-                        "properties": properties_for_llm,
-                        "required": required_params,
-                    },
-                }
-            })
+        llm_tools = [
+            _tool_metadata_for_llm(tool_def.name, tool_def.description, tool_def.parameters)
+            for tool_def in self._tools.values()
+        ]
+        for name, lazy_tool in list(self._lazy_tools.items()):
+            try:
+                parameters = lazy_tool.parameters()
+            except Exception as e:
+                logger.error(f"Error building parameters for lazily registered tool '{name}': {e}", exc_info=True)
+                continue
+            llm_tools.append(_tool_metadata_for_llm(name, lazy_tool.description, parameters))
         return llm_tools
 
+def _tool_metadata_for_llm(name: str, description: str, parameters: List[ToolParameterDefinition]) -> Dict[str, Any]:
+    """Formats one tool as an LLM function-calling entry."""
+    properties_for_llm = {}
+    required_params = []
+    for p_def in parameters:
+        param_details: Dict[str, Any] = {
+            "type": p_def.type_str,
+            "description": p_def.description,
+        }
+        properties_for_llm[p_def.name] = param_details
+        if p_def.is_required:
+            required_params.append(p_def.name)
+
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": description,
+            "parameters": {
+                "type": "object",
+                "properties": properties_for_llm,
+                "required": required_params,
+            },
+        }
+    }
+
 # Global instance of the ToolRegistry.
 global_tool_registry = ToolRegistry()
 
@@ -194,7 +270,7 @@ def create_agent_tool_registry(
         tool_def = global_registry.get_tool(tool_name)
         if tool_def:
             agent_registry.register_tool_definition(tool_def)
-            logger.debug(f"Added tool '{tool_name}' to agent '{agent_slug}' registry.")
+            logger.debug("Added tool '%s' to agent '%s' registry.", tool_name, agent_slug)
         else:
             logger.warning(f"Tool '{tool_name}' specified for agent '{agent_slug}' not found "
                            f"in the global tool registry. Skipping this tool for the agent.")
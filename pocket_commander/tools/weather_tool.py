@@ -55,7 +55,7 @@ async def get_weather(location: str) -> str:
         response = await asyncio.to_thread(requests.get, weather_url, timeout=10)
         response.raise_for_status()
         data = response.json()
-        logger.debug(f"Weather API response for {location}: {data}")
+        logger.debug("Weather API response for %s: %s", location, data)
 
         if "current" in data and "temperature_2m" in data["current"] and "weather_code" in data["current"]:
             temp = data["current"]["temperature_2m"]
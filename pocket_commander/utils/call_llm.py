@@ -6,19 +6,24 @@ import logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+try:
+    from yaml import CSafeLoader as _YAML_LOADER # LibYAML-backed parser, much faster than pure Python
+except ImportError:
+    from yaml import SafeLoader as _YAML_LOADER
+
 # Update load_profiles to use pocket_commander.conf.yaml file
 def _load_profiles(config_path="pocketflow/conf/pocket_openskad.conf.yaml"):
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        with open(config_path, 'rb') as f:
+            config = yaml.load(f, Loader=_YAML_LOADER)
             return config.get('llm-profiles', {}) or {}  # we fetch 'llm-profiles'
     except FileNotFoundError:
         # Try the alternative path if the primary is not found
         alt_config_path = "pocket_commander.conf.yaml"
         logger.warning(f"Profile configuration file not found at {config_path}, trying {alt_config_path}")
         try:
-            with open(alt_config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            with open(alt_config_path, 'rb') as f:
+                config = yaml.load(f, Loader=_YAML_LOADER)
                 return config.get('llm-profiles', {}) or {}
         except FileNotFoundError:
             raise FileNotFoundError(f"Profile configuration file not found at {config_path} or {alt_config_path}")
@@ -139,7 +144,7 @@ def call_llm(prompt_messages, profile_name="default", config_path="pocket_comman
             content_text = str(msg.get("content", ""))
             transformed_contents.append({'role': gemini_role, 'parts': [{'text': content_text}]})
 
-        logger.debug(f"Transformed contents for Gemini: {transformed_contents}")
+        logger.debug("Transformed contents for Gemini: %s", transformed_contents)
 
         model_instance = genai.GenerativeModel(profile.get('model'))
 
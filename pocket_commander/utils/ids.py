@@ -0,0 +1,33 @@
+# pocket_commander/utils/ids.py
+import collections
+import os
+from typing import Deque
+
+_UUID_POOL_SIZE = 256 # UUIDs generated per os.urandom call
+_uuid_pool: Deque[str] = collections.deque()
+
+# A forked child must not hand out the parent's pre-generated UUIDs
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+def _refill_uuid_pool() -> None:
+    raw = bytearray(os.urandom(16 * _UUID_POOL_SIZE))
+    for offset in range(0, len(raw), 16):
+        raw[offset + 6] = (raw[offset + 6] & 0x0F) | 0x40 # Version 4
+        raw[offset + 8] = (raw[offset + 8] & 0x3F) | 0x80 # RFC 4122 variant
+    h = raw.hex()
+    _uuid_pool.extend(
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, len(h), 32)
+    )
+
+def fast_uuid4_str() -> str:
+    """
+    Returns a random RFC 4122 version-4 UUID string, equivalent to str(uuid.uuid4()).
+    UUIDs are formatted from one os.urandom read per batch of _UUID_POOL_SIZE and handed
+    out from a pool, instead of building and stringifying a UUID object per call.
+    """
+    try:
+        return _uuid_pool.popleft()
+    except IndexError:
+        _refill_uuid_pool()
+        return _uuid_pool.popleft()
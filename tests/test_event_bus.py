@@ -0,0 +1,219 @@
+# tests/test_event_bus.py
+import asyncio
+import collections
+import json
+
+import zmq
+
+from pocket_commander.event_bus import ZeroMQEventBus
+
+
+def _bus() -> ZeroMQEventBus:
+    # Never started: subscriptions are only recorded locally and messages are fed to the dispatch path directly
+    return ZeroMQEventBus("tcp://127.0.0.1:5559", "tcp://127.0.0.1:5560", identity="test_bus")
+
+
+def _message(topic: str, event_data: dict):
+    return topic.encode("utf-8"), json.dumps(event_data).encode("utf-8")
+
+
+def _recorder(calls: list, label: str, result=None):
+    async def handler(topic: str, event_data: dict):
+        calls.append((label, topic, event_data))
+        return result
+    return handler
+
+
+def test_exact_and_wildcard_handlers_run_by_priority_then_subscription_order():
+    bus, calls = _bus(), []
+    bus.subscribe_nowait("app.*", _recorder(calls, "wildcard_first"))
+    bus.subscribe_nowait("app.input", _recorder(calls, "exact_second"))
+    bus.subscribe_nowait("app.inp?t", _recorder(calls, "wildcard_third"))
+    bus.subscribe_nowait("app.input", _recorder(calls, "exact_urgent"), priority=-1)
+    bus.subscribe_nowait("app.output", _recorder(calls, "other_topic"))
+
+    asyncio.run(bus._dispatch_received(*_message("app.input", {"n": 1})))
+
+    assert [label for label, _, _ in calls] == ["exact_urgent", "wildcard_first", "exact_second", "wildcard_third"]
+    assert all(topic == "app.input" and event_data == {"n": 1} for _, topic, event_data in calls)
+
+
+def test_consumed_result_stops_later_handlers():
+    bus, calls = _bus(), []
+    bus.subscribe_nowait("app.*", _recorder(calls, "consumer", ZeroMQEventBus.CONSUMED))
+    bus.subscribe_nowait("app.input", _recorder(calls, "skipped"))
+
+    asyncio.run(bus._dispatch_received(*_message("app.input", {})))
+
+    assert [label for label, _, _ in calls] == ["consumer"]
+
+
+def test_unsubscribed_exact_handler_is_no_longer_called():
+    bus, calls = _bus(), []
+    subscription_id = bus.subscribe_nowait("app.input", _recorder(calls, "exact"))
+    bus.subscribe_nowait("app.*", _recorder(calls, "wildcard"))
+
+    async def run():
+        assert await bus.unsubscribe(subscription_id)
+        await bus._dispatch_received(*_message("app.input", {}))
+
+    asyncio.run(run())
+
+    assert [label for label, _, _ in calls] == ["wildcard"]
+    assert "app.input" not in bus._exact_subscriptions
+
+
+def test_sync_and_async_handlers_are_both_dispatched():
+    bus, calls = _bus(), []
+
+    def sync_handler(topic: str, event_data: dict):
+        calls.append("sync")
+
+    async def deferred(topic: str):
+        calls.append("awaitable_from_sync")
+
+    def sync_handler_returning_awaitable(topic: str, event_data: dict):
+        return deferred(topic)
+
+    bus.subscribe_nowait("app.input", sync_handler)
+    bus.subscribe_nowait("app.input", _recorder(calls, "async"))
+    bus.subscribe_nowait("app.input", sync_handler_returning_awaitable)
+
+    asyncio.run(bus._dispatch_received(*_message("app.input", {})))
+
+    assert [call if isinstance(call, str) else call[0] for call in calls] == ["sync", "async", "awaitable_from_sync"]
+
+
+def test_sync_handler_can_consume_and_failing_handler_does_not_stop_others():
+    bus, calls = _bus(), []
+
+    def failing_handler(topic: str, event_data: dict):
+        raise RuntimeError("handler failure")
+
+    def consuming_handler(topic: str, event_data: dict):
+        calls.append("consumer")
+        return ZeroMQEventBus.CONSUMED
+
+    bus.subscribe_nowait("app.input", failing_handler)
+    bus.subscribe_nowait("app.input", consuming_handler)
+    bus.subscribe_nowait("app.input", _recorder(calls, "skipped"))
+
+    asyncio.run(bus._dispatch_received(*_message("app.input", {})))
+
+    assert calls == ["consumer"]
+
+
+def test_malformed_payload_is_skipped():
+    bus, calls = _bus(), []
+    bus.subscribe_nowait("app.input", _recorder(calls, "handler"))
+
+    asyncio.run(bus._dispatch_received(b"app.input", b"{not json"))
+
+    assert calls == []
+
+
+def test_lifecycle_events_reach_only_the_named_agent():
+    bus, calls = _bus(), []
+    main_handler = _recorder(calls, "main")
+    bus.register_lifecycle_nowait("main", main_handler)
+    bus.register_lifecycle_nowait("main", main_handler) # Duplicate registration has no effect
+    bus.register_lifecycle_nowait("composer", _recorder(calls, "composer"))
+
+    async def run():
+        await bus._dispatch_received(*_message(ZeroMQEventBus.LIFECYCLE_TOPIC, {"agent_name": "main", "lifecycle_type": "activating"}))
+        await bus._dispatch_received(*_message(ZeroMQEventBus.LIFECYCLE_TOPIC, {"agentName": "composer", "lifecycleType": "activating"}))
+        await bus._dispatch_received(*_message(ZeroMQEventBus.LIFECYCLE_TOPIC, {"agent_name": "unknown", "lifecycle_type": "activating"}))
+
+    asyncio.run(run())
+
+    assert [label for label, _, _ in calls] == ["main", "composer"]
+    assert len(bus._subscriptions) == 1 # Every agent shares the single LIFECYCLE_TOPIC subscription
+
+
+def test_unregister_lifecycle_drops_shared_subscription_with_last_handler():
+    bus, calls = _bus(), []
+    main_handler = _recorder(calls, "main")
+    composer_handler = _recorder(calls, "composer")
+
+    async def run():
+        await bus.register_lifecycle("main", main_handler)
+        await bus.register_lifecycle("composer", composer_handler)
+        assert await bus.unregister_lifecycle("main", main_handler)
+        assert not await bus.unregister_lifecycle("main", main_handler)
+        assert bus._lifecycle_subscription_id is not None
+        await bus._dispatch_received(*_message(ZeroMQEventBus.LIFECYCLE_TOPIC, {"agent_name": "main"}))
+        assert await bus.unregister_lifecycle("composer", composer_handler)
+
+    asyncio.run(run())
+
+    assert calls == []
+    assert bus._lifecycle_routes == {}
+    assert bus._lifecycle_subscription_id is None
+    assert bus._subscriptions == {}
+
+
+class _FakeSubSocket:
+    """Serves queued messages the way zmq.asyncio does: awaited receives and NOBLOCK receives both return futures."""
+
+    def __init__(self, messages):
+        self.queue = collections.deque(messages)
+        self.awaited_receives = 0
+        self.idle = asyncio.Event()
+
+    def recv_multipart(self, flags=0):
+        future = asyncio.get_running_loop().create_future()
+        if flags & zmq.NOBLOCK:
+            if self.queue:
+                future.set_result(list(self.queue.popleft()))
+            else:
+                future.set_exception(zmq.Again())
+        else:
+            self.awaited_receives += 1
+            if self.queue:
+                future.set_result(list(self.queue.popleft()))
+            else:
+                self.idle.set() # Left pending, like a receive on an empty socket
+        return future
+
+
+def _drain(message_count: int, malformed_at=()):
+    """Runs the receive loop over a burst of messages; returns the awaited receive count seen at each dispatch."""
+    bus, dispatched = _bus(), []
+    messages = [_message("app.input", {"n": n}) for n in range(message_count)]
+    for index in malformed_at:
+        messages[index] = (b"app.input",) # A single-frame message
+
+    async def run():
+        sub_socket = _FakeSubSocket(messages)
+        bus.subscribe_nowait("app.input", lambda topic, event_data: dispatched.append((sub_socket.awaited_receives, event_data["n"])))
+        bus.sub_socket = sub_socket
+        bus._running = True
+        receive_loop = asyncio.create_task(bus._message_receive_loop())
+        await sub_socket.idle.wait()
+        bus._running = False
+        receive_loop.cancel()
+        await asyncio.gather(receive_loop, return_exceptions=True)
+
+    asyncio.run(run())
+    return dispatched
+
+
+def test_receive_loop_drains_queued_messages_after_one_awaited_receive():
+    dispatched = _drain(5)
+
+    assert [n for _, n in dispatched] == list(range(5))
+    assert {awaited for awaited, _ in dispatched} == {1}
+
+
+def test_receive_loop_caps_each_drained_batch():
+    dispatched = _drain(ZeroMQEventBus._RECV_BATCH_MAX + 6)
+
+    assert [n for _, n in dispatched] == list(range(ZeroMQEventBus._RECV_BATCH_MAX + 6))
+    assert [awaited for awaited, _ in dispatched] == [1] * ZeroMQEventBus._RECV_BATCH_MAX + [2] * 6
+
+
+def test_receive_loop_skips_malformed_frames_without_dropping_the_batch():
+    dispatched = _drain(5, malformed_at=(1,))
+
+    assert [n for _, n in dispatched] == [0, 2, 3, 4]
+    assert {awaited for awaited, _ in dispatched} == {1}
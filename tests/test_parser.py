@@ -0,0 +1,41 @@
+# tests/test_parser.py
+import asyncio
+from typing import Optional
+
+import pytest
+
+from pocket_commander.commands.definition import ParameterDefinition
+from pocket_commander.commands.parser import ArgumentParsingError, parse_arguments
+from pocket_commander.commands.terminal_io import TerminalCommandInput
+
+
+def _parse(raw_input: str, params):
+    return asyncio.run(parse_arguments(TerminalCommandInput(raw_input), params))
+
+
+def test_optional_param_failing_cast_keeps_none_default():
+    params = [
+        ParameterDefinition(name="n", param_type=Optional[int], required=False),
+        ParameterDefinition(name="name", param_type=str),
+    ]
+    assert _parse("cmd abc", params) == {"n": None, "name": "abc"}
+
+
+def test_optional_param_failing_cast_keeps_explicit_default():
+    params = [
+        ParameterDefinition(name="n", param_type=int, required=False, default=5),
+        ParameterDefinition(name="name", param_type=str),
+    ]
+    assert _parse("cmd abc", params) == {"n": 5, "name": "abc"}
+
+
+def test_required_param_failing_cast_raises():
+    params = [ParameterDefinition(name="n", param_type=int)]
+    with pytest.raises(ArgumentParsingError):
+        _parse("cmd abc", params)
+
+
+def test_quoted_and_plain_input_split_alike():
+    params = [ParameterDefinition(name="*words", param_type=list)]
+    assert _parse("cmd a b", params) == {"words": ["a", "b"]}
+    assert _parse('cmd "a b" c', params) == {"words": ["a b", "c"]}
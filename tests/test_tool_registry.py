@@ -0,0 +1,91 @@
+# tests/test_tool_registry.py
+import pytest
+
+pytest.importorskip("mcp") # mcp_utils imports the MCP SDK at module level
+
+from pocket_commander.tools.definition import ToolParameterDefinition
+from pocket_commander.tools.registry import ToolRegistry, create_agent_tool_registry
+
+
+def _register_lazy(registry: ToolRegistry, tool_name: str, calls: list):
+    def parameters_factory():
+        calls.append(tool_name)
+        return [
+            ToolParameterDefinition(
+                name="path", description="File path.", param_type=str, type_str="string", is_required=True
+            )
+        ]
+
+    registry.register_mcp_tool_lazy(
+        mcp_server_name="files-server",
+        mcp_tool_name=tool_name,
+        mcp_tool_description=f"Runs {tool_name}.",
+        mcp_tool_parameters_factory=parameters_factory,
+    )
+
+
+def test_lazy_registration_defers_building():
+    registry, calls = ToolRegistry(), []
+    _register_lazy(registry, "read-file", calls)
+    assert calls == []
+    assert "mcp_files_server_read_file" in registry._lazy_tools
+    assert "mcp_files_server_read_file" not in registry._tools
+
+
+def test_get_tool_materializes_only_the_requested_tool_once():
+    registry, calls = ToolRegistry(), []
+    _register_lazy(registry, "read-file", calls)
+    _register_lazy(registry, "write-file", calls)
+
+    tool_def = registry.get_tool("mcp_files_server_read_file")
+    assert tool_def is not None
+    assert tool_def.description == "[MCP Tool on 'files-server'] Runs read-file."
+    assert [p.name for p in tool_def.parameters] == ["path"]
+    assert registry.get_tool("mcp_files_server_read_file") is tool_def
+    assert calls == ["read-file"]
+    assert list(registry._lazy_tools) == ["mcp_files_server_write_file"]
+
+
+def test_list_tools_materializes_all_pending_tools():
+    registry, calls = ToolRegistry(), []
+    _register_lazy(registry, "read-file", calls)
+    _register_lazy(registry, "write-file", calls)
+
+    names = [tool_def.name for tool_def in registry.list_tools()]
+    assert names == ["mcp_files_server_read_file", "mcp_files_server_write_file"]
+    assert registry._lazy_tools == {}
+
+
+def test_llm_metadata_does_not_materialize_lazy_tools():
+    registry, calls = ToolRegistry(), []
+    _register_lazy(registry, "read-file", calls)
+
+    metadata = registry.get_all_tools_metadata_for_llm()
+    assert metadata == [{
+        "type": "function",
+        "function": {
+            "name": "mcp_files_server_read_file",
+            "description": "[MCP Tool on 'files-server'] Runs read-file.",
+            "parameters": {
+                "type": "object",
+                "properties": {"path": {"type": "string", "description": "File path."}},
+                "required": ["path"],
+            },
+        },
+    }]
+    assert "mcp_files_server_read_file" in registry._lazy_tools
+    assert registry._tools == {}
+
+    # Parameters parsed for the metadata are reused when the tool is built
+    registry.get_tool("mcp_files_server_read_file")
+    assert calls == ["read-file"]
+
+
+def test_agent_registry_with_tool_list_materializes_only_listed_tools():
+    global_registry, calls = ToolRegistry(), []
+    _register_lazy(global_registry, "read-file", calls)
+    _register_lazy(global_registry, "write-file", calls)
+
+    agent_registry = create_agent_tool_registry("agent", ["mcp_files_server_write_file"], global_registry)
+    assert [tool_def.name for tool_def in agent_registry.list_tools()] == ["mcp_files_server_write_file"]
+    assert calls == ["write-file"]